@@ -72,3 +72,15 @@ def test_verify_directory_mismatch(tmp_path):
 
 def test_verify_directory_missing_dst(tmp_path):
     assert verify_directory(str(tmp_path / "src"), str(tmp_path / "nonexistent")) is False
+
+
+def test_verify_directory_uses_precomputed_source_hashes(tmp_path):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    src.mkdir()
+    dst.mkdir()
+    (src / "a.txt").write_text("same")
+    (dst / "a.txt").write_text("same")
+    stale = {"a.txt": compute_checksum(str(src / "a.txt"))}
+    (src / "a.txt").write_text("changed after copy")
+    assert verify_directory(str(src), str(dst), src_hashes=stale)
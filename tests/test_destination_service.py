@@ -0,0 +1,38 @@
+"""Unit tests for destination address resolver."""
+
+from whl_copy.core.destination_service import DestinationAddressResolver
+
+
+def test_resolver_classifies_addresses():
+    resolver = DestinationAddressResolver()
+    assert resolver.is_bos("bos://bucket/path")
+    assert not resolver.is_remote("bos://bucket/path")
+    assert resolver.is_remote("tester@10.10.10.5:/data")
+    assert not resolver.is_bos("tester@10.10.10.5:/data")
+    assert not resolver.is_remote("/tmp/dst")
+    assert not resolver.is_bos("/tmp/dst")
+
+
+def test_resolver_split_remote_destination():
+    resolver = DestinationAddressResolver()
+    assert resolver.split_remote_destination("tester@10.10.10.5:/data") == (
+        "tester",
+        "10.10.10.5",
+        "/data",
+    )
+
+
+def test_resolver_join_destination_local_paths():
+    resolver = DestinationAddressResolver()
+    assert resolver.join_destination("/mnt/usb", "backups/") == "/mnt/usb/backups"
+    assert resolver.join_destination("/mnt/usb/", "backups") == "/mnt/usb/backups"
+    assert resolver.join_destination("/mnt/usb", "") == "/mnt/usb"
+    assert resolver.join_destination("/mnt/usb/", "") == "/mnt/usb"
+    assert resolver.join_destination("/", "") == "/"
+    assert resolver.join_destination("", "") == "."
+    assert resolver.join_destination("/mnt//usb", "x") == "/mnt/usb/x"
+    assert resolver.join_destination("./mnt", "x") == "mnt/x"
+    assert resolver.join_destination("/mnt/usb", "a//b") == "/mnt/usb/a/b"
+    assert resolver.join_destination("/mnt/usb", "a/./b") == "/mnt/usb/a/b"
+    assert resolver.join_destination("/mnt/usb/.", "") == "/mnt/usb"
+    assert not resolver.join_destination("~", "data").startswith("~")
@@ -0,0 +1,54 @@
+"""Unit tests for the device discovery manager."""
+
+from whl_copy.discovery.base import DeviceConnection
+from whl_copy.discovery.network import NetworkSnifferDetector
+from whl_copy.discovery.registry import DeviceDiscoveryManager
+from whl_copy.discovery.static import StaticConfigDetector
+
+
+class CountingDetector:
+    def __init__(self, devices):
+        self.devices = devices
+        self.calls = 0
+
+    def detect(self):
+        self.calls += 1
+        return list(self.devices)
+
+
+def _conn(address, backend_key="filesystem"):
+    return DeviceConnection(address=address, kind="local", label=address, backend_key=backend_key)
+
+
+def test_discovery_manager_keeps_detector_order_and_survives_failures():
+    class FailingDetector:
+        def detect(self):
+            raise RuntimeError("boom")
+
+    manager = DeviceDiscoveryManager({})
+    manager.detectors = [
+        CountingDetector([_conn("/first")]),
+        FailingDetector(),
+        CountingDetector([_conn("/second"), _conn("/first")]),
+    ]
+
+    assert [c.address for c in manager.discover()] == ["/first", "/second"]
+
+
+def test_discovery_manager_network_detector_can_be_disabled():
+    enabled = DeviceDiscoveryManager({})
+    disabled = DeviceDiscoveryManager({"discovery": {"network": False}})
+
+    assert any(isinstance(d, NetworkSnifferDetector) for d in enabled.detectors)
+    assert not any(isinstance(d, NetworkSnifferDetector) for d in disabled.detectors)
+
+
+def test_static_detector_builds_devices_once():
+    detector = StaticConfigDetector(
+        {"bos": {"buckets": [{"name": "logs"}]}, "remote_candidates": [{"host": "nas", "username": "u"}]}
+    )
+
+    first = detector.detect()
+    assert [d.address for d in first] == ["bos://logs", "u@nas"]
+    first.clear()
+    assert [d.address for d in detector.detect()] == ["bos://logs", "u@nas"]
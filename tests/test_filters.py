@@ -1,5 +1,7 @@
 """Unit tests for filtering policy engine."""
 import datetime
+import fnmatch
+import os
 import pytest
 from whl_copy.policies.filtering.engine import FilterEngine
 
@@ -36,6 +38,11 @@ def test_build_source_path_missing_optional_key_defaults_empty(cfg):
     path = FilterEngine.build_source_path(cfg, "log", date="2025-11-04")
     assert path == "/mnt/autodrive_data/log/2025-11-04"
 
+def test_build_source_path_format_spec_falls_back_to_format_map(cfg):
+    cfg["rules"]["bag"]["filter"] = "run_{index:03d}"
+    path = FilterEngine.build_source_path(cfg, "bag", index=7)
+    assert path == "/mnt/autodrive_data/bag/run_007"
+
 def test_build_source_path_coredump(cfg):
     path = FilterEngine.build_source_path(cfg, "coredump", date="2025-11-04")
     assert path == "/mnt/autodrive_data/coredump/2025-11-04"
@@ -71,3 +78,58 @@ def test_build_filter_args_combined():
     args = FilterEngine.build_filter_args({"min_size": "1m", "newer_than": 30})
     assert "--min-size=1m" in args
     assert any(a.startswith("--newer=") for a in args)
+
+def test_matches_file_constraints_uses_given_stat_result(tmp_path):
+    small = tmp_path / "a.log"
+    small.write_text("x")
+    fake_stat = os.stat_result((0, 0, 0, 0, 0, 0, 4096, 0, 0, 0))
+
+    assert not FilterEngine.matches_file_constraints(small, ["*.log"], size_limit_str="1K")
+    assert FilterEngine.matches_file_constraints(small, ["*.log"], size_limit_str="1K", stat_result=fake_stat)
+
+def test_matches_file_constraints_accepts_dir_entry(tmp_path):
+    (tmp_path / "a.log").write_text("abc")
+    with os.scandir(tmp_path) as it:
+        entry = next(it)
+    assert FilterEngine.matches_file_constraints(entry, ["*.log"], size_limit_str="2")
+    assert not FilterEngine.matches_file_constraints(entry, ["*.txt"])
+
+def test_compile_patterns_matches_like_fnmatch():
+    matcher = FilterEngine.compile_patterns(["*.log", "data_?.bin"])
+    assert matcher.match("a.log")
+    assert matcher.match("data_1.bin")
+    assert not matcher.match("data_10.bin")
+    assert not matcher.match("a.log.gz")
+    assert not FilterEngine.compile_patterns([]).match("anything")
+
+def test_filter_entries_applies_name_size_and_mtime(tmp_path):
+    (tmp_path / "big.log").write_text("x" * 2048)
+    (tmp_path / "small.log").write_text("x")
+    (tmp_path / "big.txt").write_text("x" * 2048)
+    old = tmp_path / "old.log"
+    old.write_text("x" * 2048)
+    os.utime(old, (0, 0))
+
+    with os.scandir(tmp_path) as it:
+        kept = FilterEngine.filter_entries(
+            list(it), ["*.log"], size_limit_str="1K", min_modified_time=datetime.datetime(2000, 1, 1)
+        )
+        assert [entry.name for entry in kept] == ["big.log"]
+
+def test_matches_file_constraints_min_modified_time(tmp_path):
+    path = tmp_path / "a.log"
+    path.write_text("x")
+    cutoff = datetime.datetime(2020, 1, 1)
+    os.utime(path, (cutoff.timestamp() - 1, cutoff.timestamp() - 1))
+    assert not FilterEngine.matches_file_constraints(path, ["*.log"], min_modified_time=cutoff)
+    os.utime(path, (cutoff.timestamp(), cutoff.timestamp()))
+    assert FilterEngine.matches_file_constraints(path, ["*.log"], min_modified_time=cutoff)
+
+def test_compile_patterns_extension_lists_match_like_fnmatch():
+    patterns = ["*.log", "*.bag", "*"]
+    names = ["a.log", "a.log.gz", "x.bag", ".log", "noext", ""]
+    for subset in (patterns[:2], patterns):
+        matcher = FilterEngine.compile_patterns(subset)
+        for name in names:
+            expected = any(fnmatch.fnmatchcase(name, p) for p in subset)
+            assert bool(matcher.match(name)) == expected, (subset, name)
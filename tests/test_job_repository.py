@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from whl_copy.core.domain import StorageEndpoint, FilterConfig, SyncJob
 from whl_copy.core.job_repository import SyncJobRepository
@@ -23,3 +25,18 @@ def test_sync_job_repository_crud(tmp_path):
     
     repo.delete("j1")
     assert len(repo.get_all()) == 0
+
+
+def test_sync_job_repository_skips_reparse_of_unchanged_file(tmp_path, monkeypatch):
+    repo = SyncJobRepository(str(tmp_path / "jobs.json"))
+    src = StorageEndpoint(id="1", name="src", backend_key="local", address="/tmp", path="")
+    repo.save(SyncJob(id="j1", name="job", source=src, destination=src, filter_config=FilterConfig()))
+
+    loads = []
+    real_load = json.load
+    monkeypatch.setattr("whl_copy.core.job_repository.json.load", lambda f: loads.append(1) or real_load(f))
+
+    first = repo.get_all()
+    first[0].name = "mutated"
+    assert repo.get_all()[0].name == "job"
+    assert len(loads) == 1
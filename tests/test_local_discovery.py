@@ -0,0 +1,27 @@
+"""Unit tests for local/removable device discovery."""
+
+from whl_copy.discovery.local import LocalDeviceDetector
+
+
+def test_local_detector_lists_mounts_and_skips_noise(tmp_path, monkeypatch):
+    media = tmp_path / "media"
+    mnt = tmp_path / "mnt"
+    (media / "USB1").mkdir(parents=True)
+    (mnt / "data").mkdir(parents=True)
+    (mnt / "wsl").mkdir()
+    (mnt / "lost+found").mkdir()
+    (mnt / "file.txt").write_text("x")
+
+    monkeypatch.setattr(
+        "whl_copy.discovery.local._mount_roots",
+        lambda: ((str(media), "USB/HDD Volume"), (str(mnt), "Mount"), (str(tmp_path / "missing"), "Gone")),
+    )
+
+    devices = LocalDeviceDetector({}).detect()
+    removable = [(d.address, d.label) for d in devices if d.kind == "removable"]
+
+    assert removable == [
+        (str(media / "USB1"), "USB/HDD Volume: USB1"),
+        (str(mnt / "data"), "Mount: data"),
+    ]
+    assert any(d.kind == "local" for d in devices)
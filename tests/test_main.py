@@ -5,6 +5,7 @@ from unittest.mock import patch
 import pytest
 import yaml
 
+import whl_copy.main as main_module
 from whl_copy.main import load_config, main, parse_args
 from pathlib import Path
 
@@ -49,3 +50,42 @@ def test_main_wizard_run_dispatch(config_file):
 
     assert result == 0
     mock_wizard.return_value.run.assert_called_once()
+
+
+def test_load_config_reuses_cache_until_file_changes(config_file):
+    first = load_config(config_file)
+    cache = Path(config_file).with_name(".config.yml.cache.json")
+    assert cache.exists()
+
+    with patch("whl_copy.main.safe_load") as mock_load:
+        assert load_config(config_file) == first
+    mock_load.assert_not_called()
+
+    Path(config_file).write_text(yaml.dump({"wizard": {"estimated_speed_mbps": 10}}), encoding="utf-8")
+    assert load_config(config_file) == {"wizard": {"estimated_speed_mbps": 10}}
+
+
+def test_load_config_skips_cache_when_json_would_change_keys(tmp_path):
+    cfg_file = tmp_path / "config.yml"
+    cfg_file.write_text(yaml.dump({"speeds": {1: "fast"}}), encoding="utf-8")
+
+    assert load_config(str(cfg_file)) == {"speeds": {1: "fast"}}
+    assert not (tmp_path / ".config.yml.cache.json").exists()
+    assert load_config(str(cfg_file)) == {"speeds": {1: "fast"}}
+
+
+def test_ensure_user_config_seeds_once(tmp_path, monkeypatch):
+    user_dir = tmp_path / ".whl_copy"
+    monkeypatch.setattr(main_module, "_USER_DIR", user_dir)
+    monkeypatch.setattr(main_module, "_USER_CONFIG", user_dir / "config.yml")
+    monkeypatch.setattr(main_module, "_USER_PRESETS", user_dir / "presets.yml")
+    monkeypatch.setattr(main_module, "_USER_SENTINEL", user_dir / ".initialized")
+
+    main_module.ensure_user_config()
+    assert (user_dir / "config.yml").exists()
+    assert (user_dir / "presets.yml").exists()
+    assert (user_dir / ".initialized").exists()
+
+    (user_dir / "presets.yml").unlink()
+    main_module.ensure_user_config()
+    assert not (user_dir / "presets.yml").exists()
@@ -0,0 +1,94 @@
+"""Unit tests for network SSH host discovery."""
+
+import subprocess
+
+from whl_copy.discovery.network import NetworkSnifferDetector, _is_probeable
+
+
+_NEIGH_OUTPUT = (
+    "192.168.1.10 dev eth0 lladdr aa:bb:cc:dd:ee:01 REACHABLE\n"
+    "192.168.1.11 dev eth0 lladdr aa:bb:cc:dd:ee:02 STALE\n"
+    "192.168.1.12 dev eth0  FAILED\n"
+)
+
+
+def _fake_run(*_args, **_kwargs):
+    return subprocess.CompletedProcess(args=_args, returncode=0, stdout=_NEIGH_OUTPUT, stderr="")
+
+
+def test_network_detector_reports_hosts_with_open_ssh(monkeypatch):
+    monkeypatch.setattr("whl_copy.discovery.network.subprocess.run", _fake_run)
+    detector = NetworkSnifferDetector("tester")
+    detector._neigh_cmd = ["ip", "neigh", "show"]
+    probed = []
+
+    def fake_probe(ip, timeout=0.5):
+        probed.append(ip)
+        return ip == "192.168.1.11"
+
+    monkeypatch.setattr(detector, "_check_ssh_port", fake_probe)
+
+    devices = detector.detect()
+
+    assert sorted(probed) == ["192.168.1.10", "192.168.1.11"]
+    assert [d.address for d in devices] == ["tester@192.168.1.11"]
+    assert devices[0].backend_key == "remote"
+
+
+def test_network_detector_empty_neighbor_table(monkeypatch):
+    monkeypatch.setattr(
+        "whl_copy.discovery.network.subprocess.run",
+        lambda *a, **k: subprocess.CompletedProcess(args=a, returncode=0, stdout="", stderr=""),
+    )
+    detector = NetworkSnifferDetector("tester")
+    detector._neigh_cmd = ["ip", "neigh", "show"]
+    assert detector.detect() == []
+
+
+def test_network_detector_parses_arp_output(monkeypatch):
+    arp_output = (
+        "? (10.0.0.2) at aa:bb:cc:dd:ee:01 [ether] on eth0\n"
+        "gateway (10.0.0.1) at aa:bb:cc:dd:ee:02 [ether] on eth0\n"
+        "? (10.0.0.9) at <incomplete> on eth0\n"
+    )
+    monkeypatch.setattr(
+        "whl_copy.discovery.network.subprocess.run",
+        lambda *a, **k: subprocess.CompletedProcess(args=a, returncode=0, stdout=arp_output, stderr=""),
+    )
+    detector = NetworkSnifferDetector("tester")
+    detector._neigh_cmd = ["arp", "-a"]
+    probed = []
+    monkeypatch.setattr(detector, "_check_ssh_port", lambda ip, timeout=0.5: probed.append(ip) or False)
+
+    detector.detect()
+
+    assert sorted(probed) == ["10.0.0.1", "10.0.0.2"]
+
+
+def test_network_detector_without_neighbor_tool_skips_subprocess(monkeypatch):
+    def fail_run(*_args, **_kwargs):
+        raise AssertionError("subprocess should not run")
+
+    monkeypatch.setattr("whl_copy.discovery.network.subprocess.run", fail_run)
+    detector = NetworkSnifferDetector("tester")
+    detector._neigh_cmd = None
+    assert detector.detect() == []
+
+
+def test_is_probeable_skips_non_unicast_lan_addresses():
+    assert _is_probeable("192.168.1.10")
+    assert not _is_probeable("224.0.0.251")
+    assert not _is_probeable("169.254.10.1")
+    assert not _is_probeable("127.0.0.1")
+    assert not _is_probeable("fe80::1")
+    assert not _is_probeable("?")
+
+
+def test_check_ssh_port_rejects_non_ipv4_literals(monkeypatch):
+    def fail_socket(*_args, **_kwargs):
+        raise AssertionError("no socket should be opened")
+
+    monkeypatch.setattr("whl_copy.discovery.network.socket.socket", fail_socket)
+    detector = NetworkSnifferDetector("tester")
+    assert detector._check_ssh_port("example.invalid") is False
+    assert detector._check_ssh_port("fe80::1") is False
@@ -1,5 +1,8 @@
 """Tests for preset YAML repository."""
 
+import os
+
+import whl_copy.core.preset_repository as module
 from whl_copy.core.preset_repository import PresetRepository
 
 
@@ -8,3 +11,21 @@ def test_preset_repository_load_defaults_when_missing(tmp_path):
     loaded = repository.load()
     assert "profiles" in loaded
     assert "presets" in loaded
+
+
+def test_preset_repository_parses_unchanged_file_once(tmp_path, monkeypatch):
+    preset_file = tmp_path / "presets.yml"
+    preset_file.write_text("presets:\n  - name: Logs\n", encoding="utf-8")
+    parses = []
+    real_safe_load = module.safe_load
+    monkeypatch.setattr(module, "safe_load", lambda text: parses.append(text) or real_safe_load(text))
+    repository = PresetRepository(str(preset_file))
+
+    repository.get_presets()
+    repository.build_filter_from_preset("Logs")
+    assert len(parses) == 1
+
+    preset_file.write_text("presets:\n  - name: Bags\n", encoding="utf-8")
+    os.utime(preset_file, ns=(1, 1))
+    assert [p["name"] for p in repository.get_presets()] == ["Bags"]
+    assert len(parses) == 2
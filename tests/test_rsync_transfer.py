@@ -1,5 +1,9 @@
 """Contract tests for rsync transfer command construction."""
 
+import subprocess
+
+import pytest
+
 from whl_copy.storage.operations import _build_ssh_cmd, rsync_push
 
 
@@ -42,3 +46,22 @@ def test_rsync_push_builds_expected_command(monkeypatch):
     assert any(token.startswith("-e=ssh -i") for token in cmd)
     assert cmd[-2:] == ["tester@10.10.10.5:/remote/dst", "--delete"]
     assert captured["check"] is True
+
+
+def test_build_ssh_cmd_multiplex_shares_one_connection():
+    cmd = _build_ssh_cmd("~/.ssh/id_rsa", multiplex=True)
+    assert cmd.startswith("ssh -i ")
+    assert "ControlMaster=auto" in cmd
+    assert "ControlPersist=60s" in cmd
+
+
+def test_rsync_push_discards_stdout_and_reports_stderr(monkeypatch, caplog):
+    def fake_run(cmd, **kwargs):
+        assert kwargs["stdout"] is subprocess.DEVNULL
+        raise subprocess.CalledProcessError(23, cmd, stderr=b"rsync: permission denied\n")
+
+    monkeypatch.setattr("whl_copy.storage.operations.subprocess.run", fake_run)
+
+    with pytest.raises(subprocess.CalledProcessError):
+        rsync_push(src="/tmp/src", dst="/remote/dst", host="10.10.10.5", user="tester")
+    assert "permission denied" in caplog.text
@@ -1,6 +1,7 @@
 """Unit tests for whl_copy.core.scanner."""
+import os
 import pytest
-from whl_copy.core.scanner import preview_source_files, report_scan, scan_source
+from whl_copy.core.scanner import iter_scan_source, preview_source_files, report_scan, scan_source
 
 
 @pytest.fixture()
@@ -29,6 +30,23 @@ def test_scan_source_finds_existing_dir(tmp_path, cfg):
     assert any("run1.bag" in p for p in results["bag"])
 
 
+def test_scan_source_expected_file_is_returned_directly(tmp_path, cfg):
+    bag_file = tmp_path / "data" / "bag" / "2025-11-04"
+    bag_file.parent.mkdir(parents=True)
+    bag_file.write_text("bag")
+
+    results = scan_source(cfg, data_type="bag", date="2025-11-04")
+    assert results["bag"] == [str(bag_file)]
+
+
+def test_scan_source_falls_back_to_type_root(tmp_path, cfg):
+    bag_root = tmp_path / "data" / "bag"
+    (bag_root / "2025-11-03").mkdir(parents=True)
+
+    results = scan_source(cfg, data_type="bag", date="2025-11-04")
+    assert results["bag"] == [str(bag_root / "2025-11-03")]
+
+
 def test_scan_source_missing_returns_empty(tmp_path, cfg):
     results = scan_source(cfg, data_type="bag", date="2025-11-04")
     assert results["bag"] == []
@@ -41,6 +59,20 @@ def test_scan_source_all_types(tmp_path, cfg):
     assert set(results.keys()) == {"log", "bag", "coredump"}
 
 
+def test_scan_source_all_types_keeps_rule_order_and_results(tmp_path, cfg):
+    for dtype in ("log", "bag", "coredump"):
+        type_dir = tmp_path / "data" / dtype
+        type_dir.mkdir(parents=True)
+        (type_dir / f"b_{dtype}").write_text("x")
+        (type_dir / f"a_{dtype}").write_text("x")
+
+    results = scan_source(cfg)
+
+    assert list(results) == ["log", "bag", "coredump"]
+    for dtype, paths in results.items():
+        assert [p.rsplit("/", 1)[-1] for p in paths] == [f"a_{dtype}", f"b_{dtype}"]
+
+
 def test_scan_source_unknown_type_returns_empty(tmp_path, cfg):
     results = scan_source(cfg, data_type="unknown")
     assert results.get("unknown") == []
@@ -72,3 +104,70 @@ def test_preview_source_files_filters_and_totals(tmp_path):
     assert [f.name for f in files] == ["a.log"]
     assert total == 4
 
+
+
+def test_iter_scan_source_streams_pairs(tmp_path, cfg):
+    bag_dir = tmp_path / "data" / "bag" / "2025-11-04"
+    bag_dir.mkdir(parents=True)
+    (bag_dir / "run1.bag").write_text("bag")
+    (bag_dir / "run2.bag").write_text("bag")
+
+    pairs = iter_scan_source(cfg, data_type="bag", date="2025-11-04")
+    first = next(pairs)
+
+    assert first[0] == "bag"
+    assert sorted([first[1]] + [p for _, p in pairs]) == [
+        str(bag_dir / "run1.bag"),
+        str(bag_dir / "run2.bag"),
+    ]
+
+
+def test_preview_source_files_recurses_and_caps_listing(tmp_path):
+    src = tmp_path / "src"
+    (src / "nested" / "deeper").mkdir(parents=True)
+    (src / "top.log").write_text("1")
+    (src / "nested" / "mid.log").write_text("22")
+    (src / "nested" / "deeper" / "low.log").write_text("333")
+
+    files, total = preview_source_files(source=str(src), patterns=["*.log"], limit=2)
+
+    assert len(files) == 2
+    assert total == 6
+
+
+def test_preview_source_files_counts_hard_linked_bytes_once(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.log").write_text("1234")
+    os.link(src / "a.log", src / "b.log")
+    (src / "c.log").write_text("56")
+
+    files, total = preview_source_files(source=str(src), patterns=["*.log"])
+
+    assert len(files) == 2
+    assert total == 6
+
+
+def test_preview_source_files_single_file_source(tmp_path):
+    src = tmp_path / "one.log"
+    src.write_text("abc")
+
+    files, total = preview_source_files(source=str(src), patterns=["*.log"])
+
+    assert files == [src]
+    assert total == 3
+
+
+def test_scan_source_limit_keeps_newest_by_mtime(tmp_path, cfg):
+    bag_dir = tmp_path / "data" / "bag" / "2025-11-04"
+    bag_dir.mkdir(parents=True)
+    for age, name in enumerate(["c.bag", "a.bag", "b.bag"]):
+        path = bag_dir / name
+        path.write_text("bag")
+        os.utime(path, (1000 - age, 1000 - age))
+
+    newest = scan_source(cfg, data_type="bag", limit=2, order_by="mtime", date="2025-11-04")
+    by_name = scan_source(cfg, data_type="bag", limit=2, date="2025-11-04")
+
+    assert [p.rsplit("/", 1)[-1] for p in newest["bag"]] == ["c.bag", "a.bag"]
+    assert [p.rsplit("/", 1)[-1] for p in by_name["bag"]] == ["a.bag", "b.bag"]
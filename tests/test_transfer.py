@@ -1,7 +1,49 @@
 """Unit tests for local transfer operations."""
+import errno
+import hashlib
 import os
+import shutil
+import tempfile
+import traceback
+from pathlib import Path
+
 import pytest
-from whl_copy.storage.operations import local_copy
+from whl_copy.storage.operations import _HASH_COPY_CHUNK, _copy_file_hashing, local_copy
+
+_NOBODY = 65534
+
+
+@pytest.fixture()
+def unprivileged_tmp(tmp_path):
+    """A scratch dir the ``nobody`` user can write when the suite runs as root."""
+    if os.geteuid() != 0:
+        yield tmp_path
+        return
+    path = Path(tempfile.mkdtemp())
+    os.chown(path, _NOBODY, _NOBODY)
+    yield path
+    shutil.rmtree(path)
+
+
+def _run_unprivileged(fn):
+    """Run ``fn`` as ``nobody`` in a child when root, since root ignores directory modes."""
+    if os.geteuid() != 0:
+        fn()
+        return
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            os.setgid(_NOBODY)
+            os.setuid(_NOBODY)
+            fn()
+            code = 0
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
 
 
 def test_local_copy_file(tmp_path):
@@ -61,3 +103,295 @@ def test_local_copy_verify_directory_passes(tmp_path):
 
     local_copy(str(src_dir), str(dst_dir), verify=True, algorithm="md5")
     assert (dst_dir / "srcdir" / "file.txt").exists()
+
+
+def test_local_copy_resume_skips_up_to_date_files(tmp_path):
+    src_dir = tmp_path / "srcdir"
+    src_dir.mkdir()
+    (src_dir / "a.txt").write_text("new")
+    dst_dir = tmp_path / "dst"
+    local_copy(str(src_dir), str(dst_dir))
+
+    copied = dst_dir / "srcdir" / "a.txt"
+    copied.write_text("dst")  # same size, newer mtime -> kept like rsync --update
+    local_copy(str(src_dir), str(dst_dir))
+    assert copied.read_text() == "dst"
+
+    copied.write_text("longer dst")  # different size, newer mtime -> still kept
+    local_copy(str(src_dir), str(dst_dir))
+    assert copied.read_text() == "longer dst"
+
+    local_copy(str(src_dir), str(dst_dir), resume=False)
+    assert copied.read_text() == "new"
+
+
+def test_local_copy_falls_back_when_copy_file_range_unsupported(tmp_path, monkeypatch):
+    def refuse(*_args, **_kwargs):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr("whl_copy.storage.operations.os.copy_file_range", refuse, raising=False)
+    monkeypatch.setattr("whl_copy.storage.operations._HAS_COPY_FILE_RANGE", True)
+    src_file = tmp_path / "data.bin"
+    src_file.write_bytes(b"payload" * 1000)
+
+    local_copy(str(src_file), str(tmp_path / "dst"))
+
+    assert (tmp_path / "dst" / "data.bin").read_bytes() == b"payload" * 1000
+
+
+def test_local_copy_uses_cached_rsync_path_across_filesystems(tmp_path, monkeypatch):
+    captured = {}
+
+    def fail_which(*_args, **_kwargs):
+        raise AssertionError("rsync should not be looked up per call")
+
+    monkeypatch.setattr("whl_copy.storage.operations.shutil.which", fail_which)
+    monkeypatch.setattr("whl_copy.storage.operations._RSYNC_PATH", "/opt/bin/rsync")
+    monkeypatch.setattr("whl_copy.storage.operations._same_filesystem", lambda *_: False)
+    monkeypatch.setattr(
+        "whl_copy.storage.operations.subprocess.run",
+        lambda cmd, **_kwargs: captured.setdefault("cmd", cmd),
+    )
+    src_file = tmp_path / "data.bin"
+    src_file.write_bytes(b"x")
+
+    local_copy(str(src_file), str(tmp_path / "dst"))
+
+    assert captured["cmd"][0] == "/opt/bin/rsync"
+
+    src_dir = tmp_path / "srcdir"
+    src_dir.mkdir()
+    captured.clear()
+    local_copy(str(src_dir) + os.sep, str(tmp_path / "dst"))
+    assert captured["cmd"][-2:] == [str(src_dir), str(tmp_path / "dst")]
+
+
+@pytest.mark.parametrize("verify", [False, True])
+def test_local_copy_preserves_mode_and_mtime(tmp_path, verify):
+    src_file = tmp_path / "data.bin"
+    src_file.write_bytes(b"payload")
+    os.chmod(src_file, 0o640)
+    os.utime(src_file, ns=(1_000_000_000, 2_000_000_123))
+
+    local_copy(str(src_file), str(tmp_path / "dst"), verify=verify, resume=False)
+
+    copied = os.stat(tmp_path / "dst" / "data.bin")
+    assert copied.st_mode & 0o777 == 0o640
+    assert copied.st_mtime_ns == 2_000_000_123
+
+
+def test_local_copy_uses_sendfile_when_copy_file_range_refuses(tmp_path, monkeypatch):
+    real_sendfile = os.sendfile
+    calls = []
+
+    def refuse(*_args, **_kwargs):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    def counting_sendfile(*args):
+        calls.append(args)
+        return real_sendfile(*args)
+
+    monkeypatch.setattr("whl_copy.storage.operations.os.copy_file_range", refuse, raising=False)
+    monkeypatch.setattr("whl_copy.storage.operations._HAS_COPY_FILE_RANGE", True)
+    monkeypatch.setattr("whl_copy.storage.operations.os.sendfile", counting_sendfile)
+    monkeypatch.setattr("whl_copy.storage.operations.shutil.copy2", refuse)
+    src_file = tmp_path / "data.bin"
+    src_file.write_bytes(b"payload" * 1000)
+
+    local_copy(str(src_file), str(tmp_path / "dst"), resume=False)
+
+    assert calls
+    assert (tmp_path / "dst" / "data.bin").read_bytes() == b"payload" * 1000
+
+
+def test_local_copy_directory_in_parallel_keeps_tree_and_dir_times(tmp_path):
+    src_dir = tmp_path / "srcdir"
+    for i in range(3):
+        sub = src_dir / f"sub{i}"
+        sub.mkdir(parents=True)
+        for j in range(5):
+            (sub / f"f{j}.txt").write_text(f"{i}-{j}")
+        os.utime(sub, ns=(1_000_000_000, 1_000_000_000))
+
+    local_copy(str(src_dir), str(tmp_path / "dst"), verify=True, resume=False, workers=4)
+
+    for i in range(3):
+        sub = tmp_path / "dst" / "srcdir" / f"sub{i}"
+        assert sorted(p.read_text() for p in sub.iterdir()) == [f"{i}-{j}" for j in range(5)]
+        assert os.stat(sub).st_mtime_ns == 1_000_000_000
+
+
+def test_local_copy_verify_directory_with_trailing_slash_source(tmp_path):
+    src_dir = tmp_path / "srcdir"
+    (src_dir / "nested").mkdir(parents=True)
+    (src_dir / "nested" / "a.txt").write_text("a")
+
+    local_copy(str(src_dir) + os.sep, str(tmp_path / "dst"), verify=True, resume=False)
+
+    assert (tmp_path / "dst" / "srcdir" / "nested" / "a.txt").read_text() == "a"
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_local_copy_directory_recreates_hard_links(tmp_path, workers):
+    src_dir = tmp_path / "snap"
+    src_dir.mkdir()
+    (src_dir / "a.bin").write_bytes(b"x" * 100)
+    os.link(src_dir / "a.bin", src_dir / "b.bin")
+
+    local_copy(str(src_dir), str(tmp_path / "dst"), resume=False, workers=workers)
+
+    copied_a = os.stat(tmp_path / "dst" / "snap" / "a.bin")
+    copied_b = os.stat(tmp_path / "dst" / "snap" / "b.bin")
+    assert copied_a.st_ino == copied_b.st_ino
+    assert (tmp_path / "dst" / "snap" / "b.bin").read_bytes() == b"x" * 100
+
+
+@pytest.mark.parametrize("verify", [False, True])
+def test_local_copy_file_onto_itself_raises_without_truncating(tmp_path, verify):
+    src_file = tmp_path / "a.log"
+    src_file.write_text("keep")
+
+    with pytest.raises(shutil.SameFileError):
+        local_copy(str(src_file), str(tmp_path), verify=verify, resume=False)
+
+    assert src_file.read_text() == "keep"
+
+
+def test_local_copy_directory_into_its_parent_raises_without_truncating(tmp_path):
+    src_dir = tmp_path / "srcdir"
+    src_dir.mkdir()
+    (src_dir / "a.txt").write_text("keep")
+
+    with pytest.raises(shutil.SameFileError):
+        local_copy(str(src_dir), str(tmp_path), resume=False)
+
+    assert (src_dir / "a.txt").read_text() == "keep"
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_local_copy_directory_keeps_symlinks_as_links(tmp_path, workers):
+    src_dir = tmp_path / "srcdir"
+    (src_dir / "sub").mkdir(parents=True)
+    (src_dir / "sub" / "a.txt").write_text("a")
+    os.symlink(".", src_dir / "sub" / "loop")
+    os.symlink("a.txt", src_dir / "sub" / "alias.txt")
+    dst_dir = tmp_path / "dst"
+
+    local_copy(str(src_dir), str(dst_dir), workers=workers)
+    local_copy(str(src_dir), str(dst_dir), workers=workers)  # re-run replaces existing links
+
+    copied = dst_dir / "srcdir" / "sub"
+    assert os.readlink(copied / "loop") == "."
+    assert os.readlink(copied / "alias.txt") == "a.txt"
+    assert (copied / "a.txt").read_text() == "a"
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs os.mkfifo")
+def test_local_copy_directory_refuses_fifo_instead_of_blocking(tmp_path):
+    src_dir = tmp_path / "srcdir"
+    src_dir.mkdir()
+    (src_dir / "a.txt").write_text("a")
+    os.mkfifo(src_dir / "pipe")
+    dst_dir = tmp_path / "dst"
+
+    with pytest.raises(shutil.Error, match="named pipe"):
+        local_copy(str(src_dir), str(dst_dir), resume=False, workers=1)
+
+    assert (dst_dir / "srcdir" / "a.txt").read_text() == "a"
+    assert not (dst_dir / "srcdir" / "pipe").exists()
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_local_copy_read_only_directory(unprivileged_tmp, workers):
+    def copy():
+        src_dir = unprivileged_tmp / "srcdir"
+        (src_dir / "ro").mkdir(parents=True)
+        for index in range(200):
+            (src_dir / "ro" / f"{index}.txt").write_text(str(index) * 10000)
+        os.chmod(src_dir / "ro", 0o555)
+        dst_dir = unprivileged_tmp / "dst"
+
+        local_copy(str(src_dir), str(dst_dir), workers=workers)
+
+        copied = dst_dir / "srcdir" / "ro"
+        assert sorted(p.name for p in copied.iterdir()) == sorted(f"{i}.txt" for i in range(200))
+        assert (copied / "7.txt").read_text() == "7" * 10000
+        assert os.stat(copied).st_mode & 0o777 == 0o555
+        assert os.stat(copied).st_mtime_ns == os.stat(src_dir / "ro").st_mtime_ns
+
+    _run_unprivileged(copy)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_local_copy_hard_links_inside_read_only_directory(unprivileged_tmp, workers):
+    def copy():
+        snap = unprivileged_tmp / "src" / "snap"
+        snap.mkdir(parents=True)
+        (snap / "a").write_bytes(b"x" * 100)
+        os.link(snap / "a", snap / "b")
+        os.chmod(snap, 0o555)
+
+        local_copy(str(unprivileged_tmp / "src"), str(unprivileged_tmp / "dst"), resume=False, workers=workers)
+
+        copied = unprivileged_tmp / "dst" / "src" / "snap"
+        assert os.stat(copied / "a").st_ino == os.stat(copied / "b").st_ino
+        assert os.stat(copied).st_mode & 0o777 == 0o555
+
+    _run_unprivileged(copy)
+
+
+def test_local_copy_hard_link_errors_are_not_retried_as_copies(tmp_path, monkeypatch):
+    def deny(*_args, **_kwargs):
+        raise OSError(errno.EACCES, "denied")
+
+    src_dir = tmp_path / "snap"
+    src_dir.mkdir()
+    (src_dir / "a").write_text("a")
+    os.link(src_dir / "a", src_dir / "b")
+    monkeypatch.setattr("whl_copy.storage.operations.os.link", deny)
+
+    with pytest.raises(shutil.Error, match="denied"):
+        local_copy(str(src_dir), str(tmp_path / "dst"), resume=False, workers=1)
+
+    assert len(list((tmp_path / "dst" / "snap").iterdir())) == 1
+
+
+@pytest.mark.skipif(shutil.which("rsync") is None, reason="needs rsync")
+def test_local_copy_trailing_slash_layout_matches_rsync_path(tmp_path, monkeypatch):
+    src_dir = tmp_path / "srcdir"
+    (src_dir / "nested").mkdir(parents=True)
+    (src_dir / "nested" / "a.txt").write_text("a")
+
+    local_copy(str(src_dir) + os.sep, str(tmp_path / "native"))
+    monkeypatch.setattr("whl_copy.storage.operations._RSYNC_PATH", shutil.which("rsync"))
+    monkeypatch.setattr("whl_copy.storage.operations._same_filesystem", lambda *_: False)
+    local_copy(str(src_dir) + os.sep, str(tmp_path / "rsync"))
+
+    assert (tmp_path / "native" / "srcdir" / "nested" / "a.txt").read_text() == "a"
+    assert (tmp_path / "rsync" / "srcdir" / "nested" / "a.txt").read_text() == "a"
+
+
+def test_hashing_copy_survives_source_truncated_mid_copy(tmp_path, monkeypatch):
+    src_file = tmp_path / "live.log"
+    src_file.write_bytes(b"x" * (3 * _HASH_COPY_CHUNK))
+
+    class TruncatingHasher:
+        """Truncates the source after the first slice, like logrotate copytruncate."""
+
+        def __init__(self):
+            self.inner = hashlib.sha256()
+
+        def update(self, data):
+            if src_file.stat().st_size:
+                os.truncate(src_file, 0)
+            self.inner.update(data)
+
+        def hexdigest(self):
+            return self.inner.hexdigest()
+
+    monkeypatch.setattr("whl_copy.core.checksum.new_hasher", lambda _algorithm: TruncatingHasher())
+
+    digest = _copy_file_hashing(str(src_file), str(tmp_path / "copy.log"), "sha256")
+
+    assert (tmp_path / "copy.log").read_bytes() == b"x" * _HASH_COPY_CHUNK
+    assert digest == hashlib.sha256(b"x" * _HASH_COPY_CHUNK).hexdigest()
@@ -1,5 +1,7 @@
 """Unit tests for transfer storage abstractions."""
 
+import subprocess
+
 import pytest
 
 from whl_copy.storage import (
@@ -71,3 +73,50 @@ def test_build_storage_selects_remote_storage():
 def test_build_storage_selects_local_storage():
     storage = build_storage(_make_plan("/tmp/dst"))
     assert isinstance(storage, FilesystemStorage)
+
+
+def test_rsync_remote_probes_run_ssh_without_shell(monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append((cmd, kwargs))
+        if "find" in cmd:
+            stdout = "/remote/my dir/a\n/remote/my dir/b c\n"
+        else:
+            stdout = (
+                "Filesystem 1024-blocks Used Available Capacity Mounted on\n"
+                "/dev/sda1 1000 600 400 60% /remote\n"
+            )
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr("whl_copy.storage.rsync.subprocess.run", fake_run)
+    storage = RsyncStorage()
+
+    assert storage.exists("tester@10.10.10.5:/remote/my dir")
+    assert storage.get_free_space("tester@10.10.10.5:/remote/my dir") == 400 * 1024
+    assert storage.list_dirs("tester@10.10.10.5:/remote/my dir") == ["a", "b c"]
+
+    for cmd, kwargs in calls:
+        assert isinstance(cmd, list)
+        assert cmd[0] == "ssh"
+        assert "shell" not in kwargs
+    assert calls[0][0][-3:] == ["test", "-e", "'/remote/my dir'"]
+    assert calls[1][0][-3:] == ["df", "-Pk", "'/remote/my dir'"]
+    assert calls[2][0][-8:] == ["find", "'/remote/my dir'", "-mindepth", "1", "-maxdepth", "1", "-type", "d"]
+
+
+def test_filesystem_free_space_walks_up_to_existing_ancestor(tmp_path):
+    storage = FilesystemStorage()
+    assert storage.get_free_space(str(tmp_path / "not" / "yet" / "created")) > 0
+    (tmp_path / "file").write_text("x")
+    assert storage.get_free_space(str(tmp_path / "file" / "child")) > 0
+
+
+def test_filesystem_list_dirs_returns_only_directories(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "f.txt").write_text("x")
+    storage = FilesystemStorage()
+    assert sorted(storage.list_dirs(str(tmp_path))) == ["a", "b"]
+    assert storage.list_dirs(str(tmp_path / "f.txt")) == []
+    assert storage.list_dirs(str(tmp_path / "missing")) == []
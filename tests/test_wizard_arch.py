@@ -1,6 +1,7 @@
 """Architecture-focused tests for CopyWizard delegation."""
 
 from whl_copy.core.domain import CopyPlan, FilterConfig
+from whl_copy.discovery.base import DeviceConnection
 from whl_copy.wizard import CopyWizard
 
 
@@ -87,3 +88,100 @@ def test_wizard_transport_delegates_to_transport_service(tmp_path):
     wizard._transport(plan)
 
     assert service.execute_calls == [plan]
+
+
+def test_wizard_progress_bar_skips_redundant_redraws(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("whl_copy.wizard.time.monotonic", lambda: clock[0])
+    presets = tmp_path / "presets.yml"
+    presets.write_text("profiles: {}\npresets: []\n", encoding="utf-8")
+    lines = []
+
+    wizard = CopyWizard(
+        cfg={"wizard": {"estimated_speed_mbps": 80}},
+        state_file=str(tmp_path / "state.json"),
+        presets_file=str(presets),
+        logger=DummyLogger(),
+        prompt_adapter=DummyPrompt(),
+        output_func=lambda message, end="\n": lines.append(message),
+    )
+
+    wizard._progress_bar(0, width=4)
+    wizard._progress_bar(0, width=4)  # same percent
+    wizard._progress_bar(1, width=4)  # within the minimum interval
+    clock[0] += 0.06
+    wizard._progress_bar(50, width=4)
+    wizard._progress_bar(100, width=4)  # completion always draws
+
+    assert lines == ["\r[----]   0%", "\r[##--]  50%", "\r[####] 100%"]
+
+
+def test_wizard_format_size_unit_boundaries():
+    assert CopyWizard._format_size(0) == "0 B"
+    assert CopyWizard._format_size(1023) == "1023 B"
+    assert CopyWizard._format_size(1024) == "1.00 KB"
+    assert CopyWizard._format_size(1536 * 1024) == "1.50 MB"
+    assert CopyWizard._format_size(2048 << 40) == "2048.00 TB"
+
+
+def test_wizard_transport_redraws_start_after_failed_transfer(tmp_path):
+    presets = tmp_path / "presets.yml"
+    presets.write_text("profiles: {}\npresets: []\n", encoding="utf-8")
+    lines = []
+
+    wizard = CopyWizard(
+        cfg={"wizard": {"estimated_speed_mbps": 80}},
+        state_file=str(tmp_path / "state.json"),
+        presets_file=str(presets),
+        logger=DummyLogger(),
+        prompt_adapter=DummyPrompt(),
+        output_func=lambda message, end="\n": lines.append(message),
+    )
+    wizard.transport_service = FakeService()
+    plan = CopyPlan(
+        source=str(tmp_path),
+        destination=str(tmp_path / "dst"),
+        filter_config=FilterConfig(name="Custom", patterns=["*"]),
+    )
+
+    wizard._progress_bar(0)  # left at 0% by an earlier transfer that raised
+    wizard._transport(plan)
+
+    assert lines.count("\r[----------------------------]   0%") == 2
+
+
+def test_wizard_prompt_endpoint_groups_discovered_devices(tmp_path):
+    presets = tmp_path / "presets.yml"
+    presets.write_text("profiles: {}\npresets: []\n", encoding="utf-8")
+    seen = {}
+
+    class CapturingPrompt(DummyPrompt):
+        def select(self, _message, choices, default_index=0):
+            seen.setdefault("choices", choices)
+            return choices[-1]
+
+    wizard = CopyWizard(
+        cfg={"wizard": {"estimated_speed_mbps": 80}},
+        state_file=str(tmp_path / "state.json"),
+        presets_file=str(presets),
+        logger=DummyLogger(),
+        prompt_adapter=CapturingPrompt(),
+    )
+    devices = [
+        DeviceConnection(address="u@10.0.0.9", kind="network", label="sniffed", backend_key="remote"),
+        DeviceConnection(address="u@10.0.0.2", kind="remote", label="robot", backend_key="remote"),
+        DeviceConnection(address="/media/usb", kind="removable", label="usb", backend_key="filesystem"),
+        DeviceConnection(address="bos://b", kind="cloud", label="bos", backend_key="bos"),
+        DeviceConnection(address="/home/u", kind="local", label="home", backend_key="filesystem"),
+    ]
+
+    wizard._prompt_endpoint("Pick", [], devices, default_local=True)
+
+    assert seen["choices"] == [
+        "[Discovered: removable] usb (/media/usb)",
+        "[Discovered: local] home (/home/u)",
+        "[Discovered: cloud] bos (bos://b)",
+        "[Discovered: remote] robot (u@10.0.0.2)",
+        "[Discovered: network (Unverified)] sniffed (u@10.0.0.9)",
+        "[Manual] Enter a custom path",
+    ]
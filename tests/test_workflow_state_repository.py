@@ -1,5 +1,6 @@
 """Unit tests for JSON-backed workflow state repository."""
 
+import whl_copy.core.workflow_state_repository as module
 from whl_copy.core.domain import WorkflowState
 from whl_copy.core.workflow_state_repository import WorkflowStateRepository
 
@@ -35,3 +36,24 @@ def test_workflow_state_repository_save_and_load_roundtrip(tmp_path):
     assert loaded.last_backend_key == expected.last_backend_key
     assert loaded.last_name == expected.last_name
     assert loaded.last_plan == expected.last_plan
+
+
+def test_workflow_state_repository_skips_unchanged_save(tmp_path, monkeypatch):
+    writes = []
+    real_dumps = module._dumps
+    monkeypatch.setattr(module, "_dumps", lambda payload: writes.append(payload) or real_dumps(payload))
+
+    repository = WorkflowStateRepository(str(tmp_path / "state.json"))
+    state = WorkflowState(last_source="/tmp/src", last_plan={"source": "/tmp/src"})
+
+    repository.save(state)
+    repository.save(state)
+    assert len(writes) == 1
+
+    state.last_plan["source"] = "/tmp/other"
+    repository.save(state)
+    assert len(writes) == 2
+
+    reloaded = WorkflowStateRepository(str(tmp_path / "state.json"))
+    reloaded.save(reloaded.load())
+    assert len(writes) == 2
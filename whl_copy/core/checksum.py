@@ -2,7 +2,7 @@
 
 import hashlib
 from pathlib import Path
-from typing import Literal
+from typing import Dict, Literal, Optional
 
 from whl_copy.utils.logger import get_logger
 
@@ -12,25 +12,40 @@ HashAlgorithm = Literal["md5", "sha256"]
 _CHUNK_SIZE = 65536
 
 
+def new_hasher(algorithm: HashAlgorithm = "sha256"):
+    if algorithm == "sha256":
+        return hashlib.sha256()
+    if algorithm == "md5":
+        return hashlib.md5()
+    raise ValueError(f"Unsupported algorithm: {algorithm!r}.")
+
+
 def compute_checksum(path: str, algorithm: HashAlgorithm = "sha256") -> str:
     file_path = Path(path)
     if not file_path.is_file():
         raise FileNotFoundError(f"File not found: {path}")
 
-    if algorithm == "sha256":
-        hasher = hashlib.sha256()
-    elif algorithm == "md5":
-        hasher = hashlib.md5()
-    else:
-        raise ValueError(f"Unsupported algorithm: {algorithm!r}.")
-
+    hasher = new_hasher(algorithm)
     with open(file_path, "rb") as handle:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: hashes with C-level reads
+            return hashlib.file_digest(handle, lambda: hasher).hexdigest()
         for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
             hasher.update(chunk)
     return hasher.hexdigest()
 
 
-def verify_directory(src_dir: str, dst_dir: str, algorithm: HashAlgorithm = "sha256") -> bool:
+def verify_directory(
+    src_dir: str,
+    dst_dir: str,
+    algorithm: HashAlgorithm = "sha256",
+    src_hashes: Optional[Dict[str, str]] = None,
+) -> bool:
+    """Compare every file under ``dst_dir`` with its counterpart in ``src_dir``.
+
+    ``src_hashes`` maps POSIX relative paths to source digests already
+    computed (e.g. while copying); those source files are not re-read.
+    """
+    src_hashes = src_hashes or {}
     dst_root = Path(dst_dir)
     src_root = Path(src_dir)
     if not dst_root.is_dir():
@@ -50,7 +65,7 @@ def verify_directory(src_dir: str, dst_dir: str, algorithm: HashAlgorithm = "sha
             all_ok = False
             continue
 
-        src_hash = compute_checksum(str(src_file), algorithm)
+        src_hash = src_hashes.get(relative.as_posix()) or compute_checksum(str(src_file), algorithm)
         dst_hash = compute_checksum(str(dst_file), algorithm)
         if src_hash != dst_hash:
             logger.error(
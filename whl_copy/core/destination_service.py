@@ -2,17 +2,47 @@
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
+
+_LOCAL = 0
+_REMOTE = 1
+_BOS = 2
+
+_BOS_PREFIX = "bos://"
+_BOS_PREFIX_LEN = len(_BOS_PREFIX)
+
+
+@lru_cache(maxsize=1024)
+def _classify_address(address: str) -> int:
+    """Classify an address once; devices repeat heavily across plans and jobs."""
+    if address[:_BOS_PREFIX_LEN] == _BOS_PREFIX:
+        return _BOS
+    if "@" in address and ":" in address:
+        return _REMOTE
+    return _LOCAL
+
+
+def _strip_bos(address: str) -> Optional[str]:
+    """Return the bucket/key body of a ``bos://`` address, or None if not BOS."""
+    if address[:_BOS_PREFIX_LEN] == _BOS_PREFIX:
+        return address[_BOS_PREFIX_LEN:]
+    return None
+
+
+_expanduser = lru_cache(maxsize=128)(os.path.expanduser)
+
 
 class DestinationAddressResolver:
     @staticmethod
     def is_remote(address: str) -> bool:
-        return "@" in address and ":" in address
+        return _classify_address(address) == _REMOTE
 
     @staticmethod
     def is_bos(address: str) -> bool:
-        return address.startswith("bos://")
+        return _classify_address(address) == _BOS
 
     def join_destination(self, device: str, save_dir: str) -> str:
         clean_dir = (save_dir or "").strip().strip("/")
@@ -29,15 +59,18 @@ class DestinationAddressResolver:
         if "@" in device and ":" not in device: # new backend handling simple addresses
             return f"{device}:{clean_dir}"
 
-        device_path = Path(device).expanduser()
+        if device.startswith("~"):
+            device = _expanduser(device)
+        # Path collapses "//", "." segments and trailing slashes; "" becomes ".".
+        device_path = Path(device)
         return str(device_path / clean_dir) if clean_dir else str(device_path)
 
     def split_destination(self, destination: str) -> Tuple[str, str]:
-        if self.is_bos(destination):
-            cleaned = destination.rstrip("/")
-            head, sep, tail = cleaned.rpartition("/")
-            if sep and head.startswith("bos://"):
-                return head, tail
+        body = _strip_bos(destination)
+        if body is not None:
+            head, sep, tail = body.rstrip("/").rpartition("/")
+            if sep:
+                return _BOS_PREFIX + head, tail
             return destination, ""
 
         if self.is_remote(destination):
@@ -1,8 +1,9 @@
 """Repository for managing saved endpoints/profiles."""
 
 import json
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from whl_copy.core.domain import StorageEndpoint
 
@@ -10,21 +11,29 @@ from whl_copy.core.domain import StorageEndpoint
 class EndpointRepository:
     def __init__(self, storage_file: str):
         self.storage_file = Path(storage_file)
+        # Raw records keyed by (mtime_ns, size); an unchanged file is not re-read.
+        self._cache: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]]]] = None
 
     def _load_all(self) -> List[StorageEndpoint]:
-        if not self.storage_file.exists():
-            return []
         try:
-            with open(self.storage_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return [StorageEndpoint.from_dict(item) for item in data]
-        except (json.JSONDecodeError, IOError):
+            st = os.stat(self.storage_file)
+        except FileNotFoundError:
             return []
+        key = (st.st_mtime_ns, st.st_size)
+        if self._cache is None or self._cache[0] != key:
+            try:
+                with open(self.storage_file, "r", encoding="utf-8") as f:
+                    self._cache = (key, json.load(f))
+            except (json.JSONDecodeError, IOError):
+                return []
+        # Fresh objects per call, so callers may mutate what they get back.
+        return [StorageEndpoint.from_dict(item) for item in self._cache[1]]
 
     def _save_all(self, endpoints: List[StorageEndpoint]) -> None:
         self.storage_file.parent.mkdir(parents=True, exist_ok=True)
         with open(self.storage_file, "w", encoding="utf-8") as f:
             json.dump([b.to_dict() for b in endpoints], f, indent=2)
+        self._cache = None
 
     def get_all(self) -> List[StorageEndpoint]:
         return self._load_all()
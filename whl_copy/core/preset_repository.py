@@ -3,29 +3,36 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List, Optional
-
-import yaml
+from typing import Dict, List, Optional, Tuple
 
 from whl_copy.core.domain import FilterConfig, Profile
+from whl_copy.utils.yaml_loader import safe_load
 
 
 class PresetRepository:
     def __init__(self, preset_file: str):
         self.path = Path(preset_file).expanduser()
+        # Parsed file keyed by (mtime_ns, size): listing N presets used to
+        # re-read and re-parse the YAML 2N+1 times.
+        self._cache: Optional[Tuple[Tuple[int, int], Dict]] = None
 
     def load(self) -> Dict:
-        if not self.path.exists():
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
             return {
                 "profiles": Profile.default().atomic_rules,
                 "presets": [],
             }
 
-        content = yaml.safe_load(self.path.read_text(encoding="utf-8")) or {}
-        return {
-            "profiles": content.get("profiles") or Profile.default().atomic_rules,
-            "presets": content.get("presets") or [],
-        }
+        key = (st.st_mtime_ns, st.st_size)
+        if self._cache is None or self._cache[0] != key:
+            content = safe_load(self.path.read_text(encoding="utf-8")) or {}
+            self._cache = (key, {
+                "profiles": content.get("profiles") or Profile.default().atomic_rules,
+                "presets": content.get("presets") or [],
+            })
+        return dict(self._cache[1])
 
     def get_presets(self) -> List[Dict]:
         data = self.load()
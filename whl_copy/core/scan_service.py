@@ -15,15 +15,11 @@ class SourceScanService:
         self.address_resolver = address_resolver or DestinationAddressResolver()
 
     def preview(self, plan: CopyPlan) -> Tuple[List[Path], int]:
-        if self.address_resolver.is_remote(plan.source) or plan.source.startswith("bos://"):
+        # Any URI (bos://, ...) or user@host:path source cannot be scanned locally;
+        # missing local paths are handled by preview_source_files itself.
+        if "://" in plan.source or self.address_resolver.is_remote(plan.source):
             return [], 0
 
-        # Attempt to quickly verify local path existence if it's not a remote/URI
-        if "://" not in plan.source and "@" not in plan.source:
-            source_path = Path(plan.source).expanduser()
-            if not source_path.exists():
-                return [], 0
-
         return preview_source_files(
             source=plan.source,
             patterns=plan.filter_config.patterns,
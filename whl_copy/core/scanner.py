@@ -1,61 +1,142 @@
 """Source scanner and preview helpers."""
 
+import heapq
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Generator, Iterator, List, Optional, Set, Tuple
 
 from whl_copy.policies.filtering import FilterEngine
 from whl_copy.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_MAX_SCAN_WORKERS = 8
+
+
+def _drain_entries(dtype: str, entries: Any) -> Generator[Tuple[str, str], None, int]:
+    """Yield ``(dtype, path)`` for an open scandir iterator; return the count."""
+    count = 0
+    with entries:
+        for entry in entries:
+            count += 1
+            yield dtype, entry.path
+    return count
+
+
+def _types_to_scan(cfg: dict, data_type: Optional[str]) -> List[str]:
+    return [data_type] if data_type else list(cfg.get("rules", {}).keys())
+
+
+def _iter_type(
+    cfg: dict,
+    dtype: str,
+    filter_kwargs: Dict[str, Any],
+) -> Iterator[Tuple[str, str]]:
+    rules = cfg.get("rules", {})
+    if dtype not in rules:
+        logger.warning("No rule defined for data type: %s", dtype)
+        return
+
+    try:
+        expected = FilterEngine.build_source_path(cfg, dtype, **filter_kwargs)
+    except KeyError:
+        logger.warning("Cannot build path for data type: %s", dtype)
+        return
+
+    # One scandir() per path replaces the exists()/is_dir() stat ladder:
+    # its errors tell us whether the path is a file or missing.
+    try:
+        entries = os.scandir(expected)
+    except NotADirectoryError:
+        yield dtype, expected
+        logger.info("[%s] Found %d item(s) at %s", dtype, 1, expected)
+        return
+    except FileNotFoundError:
+        entries = None
+
+    if entries is not None:
+        count = yield from _drain_entries(dtype, entries)
+        logger.info("[%s] Found %d item(s) at %s", dtype, count, expected)
+        return
+
+    type_root = os.path.join(cfg["source"]["base_path"], rules[dtype]["path"])
+    try:
+        entries = os.scandir(type_root)
+    except (FileNotFoundError, NotADirectoryError):
+        logger.warning("[%s] Source directory not found: %s", dtype, type_root)
+        return
+
+    count = yield from _drain_entries(dtype, entries)
+    logger.info(
+        "[%s] Expected path %s not found; listing type root (%d items)",
+        dtype,
+        expected,
+        count,
+    )
+
+
+def iter_scan_source(
+    cfg: dict,
+    data_type: str = None,
+    **filter_kwargs: Any,
+) -> Iterator[Tuple[str, str]]:
+    """Lazily yield ``(data_type, path)`` pairs in directory order.
+
+    Nothing is materialized, so callers can start filtering/transferring
+    before a huge directory has been fully read.
+    """
+    for dtype in _types_to_scan(cfg, data_type):
+        yield from _iter_type(cfg, dtype, filter_kwargs)
+
+
+def _mtime(path: str) -> float:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0.0
+
+
+def _select(paths: Iterator[str], limit: Optional[int], order_by: Optional[str]) -> List[str]:
+    """Order (and optionally cap) one type's paths without sorting more than needed.
+
+    ``order_by`` is ``"name"`` (ascending), ``"mtime"`` (newest first) or
+    ``None`` (directory order). With a ``limit`` a bounded heap keeps only
+    the K best paths: O(N log K) time and O(K) memory.
+    """
+    if order_by is None:
+        return list(paths if limit is None else islice(paths, limit))
+    if order_by == "name":
+        return sorted(paths) if limit is None else heapq.nsmallest(limit, paths)
+    if order_by == "mtime":
+        if limit is None:
+            return sorted(paths, key=_mtime, reverse=True)
+        return heapq.nlargest(limit, paths, key=_mtime)
+    raise ValueError(f"Unsupported order_by: {order_by}")
+
 
 def scan_source(
     cfg: dict,
     data_type: str = None,
+    limit: Optional[int] = None,
+    order_by: Optional[str] = "name",
     **filter_kwargs: Any,
 ) -> Dict[str, List[str]]:
-    base = Path(cfg["source"]["base_path"])
-    rules = cfg.get("rules", {})
-    types_to_scan = [data_type] if data_type else list(rules.keys())
-
-    results: Dict[str, List[str]] = {}
+    types_to_scan = _types_to_scan(cfg, data_type)
 
-    for dtype in types_to_scan:
-        if dtype not in rules:
-            logger.warning("No rule defined for data type: %s", dtype)
-            results[dtype] = []
-            continue
+    def _scan_one(dtype: str) -> Tuple[str, List[str]]:
+        paths = (path for _, path in _iter_type(cfg, dtype, filter_kwargs))
+        return dtype, _select(paths, limit, order_by)
 
-        try:
-            expected = Path(FilterEngine.build_source_path(cfg, dtype, **filter_kwargs))
-        except KeyError:
-            logger.warning("Cannot build path for data type: %s", dtype)
-            results[dtype] = []
-            continue
+    if len(types_to_scan) <= 1:
+        return dict(map(_scan_one, types_to_scan))
 
-        if expected.exists():
-            if expected.is_dir():
-                found = [str(p) for p in sorted(expected.iterdir())]
-            else:
-                found = [str(expected)]
-            results[dtype] = found
-            logger.info("[%s] Found %d item(s) at %s", dtype, len(found), expected)
-        else:
-            type_root = base / rules[dtype]["path"]
-            if type_root.is_dir():
-                found = [str(p) for p in sorted(type_root.iterdir())]
-                results[dtype] = found
-                logger.info(
-                    "[%s] Expected path %s not found; listing type root (%d items)",
-                    dtype,
-                    expected,
-                    len(found),
-                )
-            else:
-                logger.warning("[%s] Source directory not found: %s", dtype, type_root)
-                results[dtype] = []
-
-    return results
+    # Each type lives in its own directory; scandir releases the GIL, so the
+    # scans overlap their I/O waits (cold cache, NFS) instead of adding up.
+    with ThreadPoolExecutor(max_workers=min(_MAX_SCAN_WORKERS, len(types_to_scan))) as executor:
+        return dict(executor.map(_scan_one, types_to_scan))
 
 
 def report_scan(results: Dict[str, List[str]]) -> None:
@@ -70,6 +151,26 @@ def report_scan(results: Dict[str, List[str]]) -> None:
     print()
 
 
+def _iter_files(root: str) -> Iterator[os.DirEntry]:
+    """Recursively yield regular-file entries under ``root``.
+
+    Like ``Path.rglob("*")`` this does not descend into symlinked directories,
+    but file type comes from readdir rather than a stat per entry.
+    """
+    pending = [root]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
 def preview_source_files(
     source: str,
     patterns: List[str],
@@ -77,26 +178,42 @@ def preview_source_files(
     size_limit_str: int = 0,
     limit: int = 50,
 ) -> Tuple[List[Path], int]:
-    source_path = Path(source).expanduser()
-    if not source_path.exists():
+    root = os.path.expanduser(source)
+    try:
+        root_stat = os.stat(root)
+    except OSError:
         return [], 0
 
-    candidates = [source_path] if source_path.is_file() else list(source_path.rglob("*"))
-    files = [item for item in candidates if item.is_file()]
-
     min_modified_time = FilterEngine.resolve_min_modified_time(time_range)
+    matcher = FilterEngine.compile_patterns(patterns)
+    size_limit = FilterEngine.parse_size_limit(size_limit_str)
     matched: List[Path] = []
     total_bytes = 0
 
-    for file_path in files:
-        if not FilterEngine.matches_file_constraints(
+    if stat.S_ISREG(root_stat.st_mode):
+        file_path = Path(root)
+        if FilterEngine.matches_file_constraints(
             file_path=file_path,
-            patterns=patterns,
-            size_limit_str=size_limit_str,
+            patterns=matcher,
+            size_limit_str=size_limit,
             min_modified_time=min_modified_time,
+            stat_result=root_stat,
         ):
-            continue
-        matched.append(file_path)
-        total_bytes += file_path.stat().st_size
+            return [file_path][:limit], root_stat.st_size
+        return [], 0
 
-    return matched[:limit], total_bytes
+    # Copies recreate hard links inside the tree, so each inode is counted once.
+    seen_inodes: Set[Tuple[int, int]] = set()
+    for entry in FilterEngine.filter_entries(_iter_files(root), matcher, size_limit, min_modified_time):
+        # DirEntry caches its stat, so this reuses the one the filter took.
+        st = entry.stat()
+        if st.st_nlink > 1:
+            inode = (st.st_dev, st.st_ino)
+            if inode in seen_inodes:
+                continue
+            seen_inodes.add(inode)
+        total_bytes += st.st_size
+        if len(matched) < limit:
+            matched.append(Path(entry.path))
+
+    return matched, total_bytes
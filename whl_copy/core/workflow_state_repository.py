@@ -1,42 +1,60 @@
 """Workflow state repository backed by JSON."""
 
 import json
+import os
+from dataclasses import asdict, fields
 from pathlib import Path
+from typing import Any, Dict, Optional
 
 from whl_copy.core.domain import WorkflowState
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(payload) -> bytes:
+        return orjson.dumps(payload)
+else:
+    _loads = json.loads
+
+    def _dumps(payload) -> bytes:
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+_STATE_FIELDS = tuple(f.name for f in fields(WorkflowState))
+
 
 class WorkflowStateRepository:
     def __init__(self, state_file: str):
         self.path = Path(state_file).expanduser()
+        # Snapshot of what is known to be on disk; lets save() skip no-op writes.
+        self._last_payload: Optional[Dict[str, Any]] = None
 
     def load(self) -> WorkflowState:
         if not self.path.exists():
             return WorkflowState()
 
-        data = json.loads(self.path.read_text(encoding="utf-8"))
-        return WorkflowState(
-            last_source=data.get("last_source"),
-            last_dest=data.get("last_dest"),
-            last_device=data.get("last_device"),
-            last_save_dir=data.get("last_save_dir"),
-            last_backend_key=data.get("last_backend_key"),
-            last_name=data.get("last_name"),
-            last_plan=data.get("last_plan"),
-        )
+        data = _loads(self.path.read_bytes())
+        state = WorkflowState(**{name: data.get(name) for name in _STATE_FIELDS})
+        self._last_payload = asdict(state)
+        return state
 
     def save(self, state: WorkflowState) -> None:
+        # asdict() deep-copies nested dicts, so later in-place edits to
+        # state.last_plan cannot make the snapshot look clean.
+        payload = asdict(state)
+        if payload == self._last_payload:
+            return
+
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {
-            "last_source": state.last_source,
-            "last_dest": state.last_dest,
-            "last_device": state.last_device,
-            "last_save_dir": state.last_save_dir,
-            "last_backend_key": state.last_backend_key,
-            "last_name": state.last_name,
-            "last_plan": state.last_plan,
-        }
-        self.path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        # Write to a temp file and swap it in so a crash mid-write never
+        # leaves a truncated state file behind.
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_bytes(_dumps(payload))
+        os.replace(tmp_path, self.path)
+        self._last_payload = payload
@@ -4,13 +4,59 @@ from __future__ import annotations
 
 import os
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Tuple
 import getpass
 
 from whl_copy.discovery.base import DeviceConnection
 
 
+@lru_cache(maxsize=None)
+def _current_user() -> str:
+    """Login name; resolved once per process since it cannot change mid-run.
+
+    $USER/$LOGNAME are checked first so the passwd/NSS lookup inside
+    getpass.getuser() only happens when neither is set.
+    """
+    return os.environ.get("USER") or os.environ.get("LOGNAME") or getpass.getuser()
+
+
+@lru_cache(maxsize=None)
+def _home_dir() -> str:
+    return str(Path.home())
+
+
+# Mount-point names that are never user data volumes (WSL drive root, optical
+# drive placeholder, snap squashfs mounts, fsck recovery dir).
+_IGNORED_MOUNT_NAMES = frozenset({"wsl", "cdrom", "snap", "lost+found"})
+
+
+def _mount_roots() -> Tuple[Tuple[str, str], ...]:
+    """(root, label prefix) pairs scanned for removable volumes."""
+    return (
+        (f"/media/{_current_user()}", "USB/HDD Volume"),
+        ("/mnt", "Mount"),
+    )
+
+
+def _iter_mounts() -> Iterator[Tuple[os.DirEntry, str]]:
+    """Yield (entry, label prefix) for candidate volumes under every mount root.
+
+    Uses dirent type info, so no per-child stat; noise names are rejected
+    before the type check. Missing or unreadable roots are skipped.
+    """
+    for root, label_prefix in _mount_roots():
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.name in _IGNORED_MOUNT_NAMES or not entry.is_dir():
+                        continue
+                    yield entry, label_prefix
+        except OSError:
+            continue
+
+
 class LocalDeviceDetector:
     """Discovers local directories and externally mounted USB/HDD volumes."""
 
@@ -21,38 +67,18 @@ class LocalDeviceDetector:
         devices = []
 
         # 1. Externally mounted volumes (USB, HDD) - standard Linux behavior
-        user = getpass.getuser()
-        
-        # Check /media/{user}/
-        media_path = Path(f"/media/{user}")
-        if media_path.exists() and media_path.is_dir():
-            for child in media_path.iterdir():
-                if child.is_dir():
-                    devices.append(
-                        DeviceConnection(
-                            address=str(child),
-                            kind="removable",
-                            label=f"USB/HDD Volume: {child.name}",
-                            backend_key="filesystem",
-                        )
-                    )
-        
-        # Check /mnt/
-        mnt_path = Path("/mnt")
-        if mnt_path.exists() and mnt_path.is_dir():
-             for child in mnt_path.iterdir():
-                if child.is_dir() and child.name != "wsl": # ignore wsl if on windows
-                    devices.append(
-                        DeviceConnection(
-                            address=str(child),
-                            kind="removable",
-                            label=f"Mount: {child.name}",
-                            backend_key="filesystem",
-                        )
-                    )
+        for entry, label_prefix in _iter_mounts():
+            devices.append(
+                DeviceConnection(
+                    address=entry.path,
+                    kind="removable",
+                    label=f"{label_prefix}: {entry.name}",
+                    backend_key="filesystem",
+                )
+            )
 
         # 2. Key local directories (Home, CWD)
-        home = str(Path.home())
+        home = _home_dir()
         devices.append(
             DeviceConnection(
                 address=home,
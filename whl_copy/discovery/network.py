@@ -2,15 +2,55 @@
 
 from __future__ import annotations
 
+import errno
+import ipaddress
+import re
+import select
+import shutil
 import socket
+import struct
 import subprocess
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 from whl_copy.discovery.base import DeviceConnection
 from whl_copy.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Probes are I/O-bound; cap concurrency so large ARP tables don't exhaust fds.
+_MAX_PROBE_WORKERS = 64
+
+# l_onoff=1, l_linger=0: close() resets the probe connection immediately
+# instead of a FIN handshake that leaves the socket in TIME_WAIT.
+_ABORTIVE_LINGER = struct.pack("ii", 1, 0)
+
+# Matches both `ip neigh` ("10.0.0.2 dev eth0 ... REACHABLE") and `arp -a`
+# ("? (10.0.0.2) at aa:bb:... [ether] on eth0") lines in a single pass.
+_NEIGH_RE = re.compile(
+    r"^(?:\S+[ \t]+\()?([^\s()]+)\)?[ \t].*?\b(?:REACHABLE|STALE|PERMANENT|ether)\b",
+    re.MULTILINE,
+)
+
+
+def _is_probeable(ip: str) -> bool:
+    """Filter out neighbor entries that can never be an SSH target worth probing."""
+    try:
+        addr = ipaddress.ip_address(ip)
+    except ValueError:
+        return False
+    # The probe socket is AF_INET only.
+    if addr.version != 4:
+        return False
+    return not (
+        addr.is_multicast
+        or addr.is_link_local
+        or addr.is_loopback
+        or addr.is_unspecified
+        or addr.is_reserved
+    )
+
+
 class NetworkSnifferDetector:
     """Discovers devices on the local network by checking ARP tables and port 22."""
     
@@ -18,28 +58,42 @@ class NetworkSnifferDetector:
         if isinstance(username, dict):
             username = username.get("username", "root")
         self.default_user = str(username)
+        self._neigh_cmd = self._resolve_neigh_cmd()
+
+    @staticmethod
+    def _resolve_neigh_cmd() -> Optional[List[str]]:
+        """Pick the neighbor-table tool once instead of trying both per call."""
+        if shutil.which("ip"):
+            return ["ip", "neigh", "show"]
+        if shutil.which("arp"):
+            return ["arp", "-a"]
+        return None
 
     def detect(self) -> List[DeviceConnection]:
         devices = []
+        if self._neigh_cmd is None:
+            logger.debug("Network sniffing skipped: neither 'ip' nor 'arp' is available")
+            return devices
         try:
             # Simple ARP-based discovery (requires 'arp' or 'ip' command)
             # In a robust implementation, you might use python-nmap or native sockets.
-            cmd = "ip neigh show"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode != 0:
-                cmd = "arp -a"
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            
-            ips_to_test = set()
-            for line in result.stdout.splitlines():
-                if "REACHABLE" in line or "STALE" in line or "ether" in line:
-                    parts = line.split()
-                    if parts:
-                        ip = parts[0].strip("()")
-                        ips_to_test.add(ip)
-                        
-            for ip in ips_to_test:
-                if self._check_ssh_port(ip):
+            result = subprocess.run(self._neigh_cmd, capture_output=True, text=True, check=False)
+
+            ips_to_test = {
+                ip for ip in (match.group(1) for match in _NEIGH_RE.finditer(result.stdout))
+                if _is_probeable(ip)
+            }
+
+            ips = sorted(ips_to_test)
+            if not ips:
+                return devices
+
+            # Probe all hosts concurrently so discovery costs ~one timeout, not N.
+            with ThreadPoolExecutor(max_workers=min(_MAX_PROBE_WORKERS, len(ips))) as executor:
+                reachable = list(executor.map(self._check_ssh_port, ips))
+
+            for ip, is_open in zip(ips, reachable):
+                if is_open:
                     devices.append(
                         DeviceConnection(
                             address=f"{self.default_user}@{ip}",
@@ -56,10 +110,24 @@ class NetworkSnifferDetector:
 
     def _check_ssh_port(self, ip: str, timeout: float = 0.5) -> bool:
         """Quickly check if port 22 is open on the target IP."""
+        # Only IPv4 literals are probed; rejecting anything else up front keeps
+        # connect_ex() from falling back to a blocking hostname lookup.
+        try:
+            socket.inet_pton(socket.AF_INET, ip)
+        except OSError:
+            return False
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(timeout)
-                s.connect((ip, 22))
-                return True
-        except (socket.timeout, ConnectionRefusedError, OSError):
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP) as s:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _ABORTIVE_LINGER)
+                s.setblocking(False)
+                err = s.connect_ex((ip, 22))
+                if err == 0:
+                    return True
+                if err not in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN):
+                    return False
+                _, writable, _ = select.select([], [s], [], timeout)
+                if not writable:
+                    return False
+                return s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+        except (OSError, ValueError):
             return False
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-from typing import List
-from whl_copy.discovery.base import DeviceConnection
+from typing import Dict, List, Tuple
+from whl_copy.discovery.base import DeviceConnection, DeviceDetector
 from whl_copy.discovery.network import NetworkSnifferDetector
 from whl_copy.discovery.static import StaticConfigDetector
 from whl_copy.discovery.local import LocalDeviceDetector
@@ -17,28 +18,28 @@ class DeviceDiscoveryManager:
 
     def __init__(self, config: dict):
         self.config = config
-        self.detectors = [
+        discovery_cfg = config.get('discovery', {})
+        self.detectors: List[DeviceDetector] = [
             LocalDeviceDetector(config),
             StaticConfigDetector(config),
-            NetworkSnifferDetector(config.get('destination', {}).get('username', 'root'))
         ]
+        # ARP parsing + SSH probing is by far the slowest step; local-only users can opt out.
+        if discovery_cfg.get('network', True):
+            self.detectors.append(NetworkSnifferDetector(config.get('destination', {}).get('username', 'root')))
 
     def discover(self) -> List[DeviceConnection]:
         """Runs all detectors to array DeviceConnections."""
-        all_connections: List[DeviceConnection] = []
-        for detector in self.detectors:
-            try:
-                found = detector.detect()
-                if found:
-                    all_connections.extend(found)
-            except Exception as e:
-                logger.error(f"Detector {detector.__class__.__name__} failed: {e}")
-
-        # Basic deduplication based on Address + Backend type
-        unique_connections = {}
-        for conn in all_connections:
-            key = f"{conn.backend_key}://{conn.address}"
-            if key not in unique_connections:
-                unique_connections[key] = conn
-                
+        # Deduplicate on (backend, address) while accumulating; first detector wins.
+        unique_connections: Dict[Tuple[str, str], DeviceConnection] = {}
+        # Detectors are independent and mostly I/O-bound (network probes dominate),
+        # so overlap them; results are still merged in detector order.
+        with ThreadPoolExecutor(max_workers=max(1, len(self.detectors))) as executor:
+            futures = [(detector, executor.submit(detector.detect)) for detector in self.detectors]
+            for detector, future in futures:
+                try:
+                    for conn in future.result() or ():
+                        unique_connections.setdefault((conn.backend_key, conn.address), conn)
+                except Exception as e:
+                    logger.error(f"Detector {detector.__class__.__name__} failed: {e}")
+
         return list(unique_connections.values())
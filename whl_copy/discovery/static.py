@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional, Tuple
 
 from whl_copy.discovery.base import DeviceConnection
 
@@ -12,12 +12,22 @@ class StaticConfigDetector:
 
     def __init__(self, cfg: dict):
         self.cfg = cfg
+        self._devices: Optional[Tuple[DeviceConnection, ...]] = None
 
     def detect(self) -> List[DeviceConnection]:
+        # Config is immutable for the lifetime of a run, so build the list once.
+        # Built on first use (not in __init__) so malformed entries still surface
+        # through the discovery manager's per-detector error handling.
+        if self._devices is None:
+            self._devices = tuple(self._build_devices(self.cfg))
+        return list(self._devices)
+
+    @staticmethod
+    def _build_devices(cfg: dict) -> List[DeviceConnection]:
         devices = []
-        
+
         # Parse BOS buckets
-        bos_cfg = self.cfg.get("bos", {})
+        bos_cfg = cfg.get("bos", {})
         if "buckets" in bos_cfg:
             for bucket in bos_cfg["buckets"]:
                 name = bucket["name"]
@@ -31,7 +41,7 @@ class StaticConfigDetector:
                 )
 
         # Parse static remote targets mapping
-        remote_cfg = self.cfg.get("remote_candidates", [])
+        remote_cfg = cfg.get("remote_candidates", [])
         for rc in remote_cfg:
             user = rc.get("username", "root")
             host = rc.get("host")
@@ -4,12 +4,16 @@
 from __future__ import annotations
 
 import argparse
+import json
+import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 import yaml
 
 from whl_copy.utils.logger import get_logger
+from whl_copy.utils.yaml_loader import safe_load
 from whl_copy.wizard import CopyWizard
 
 
@@ -22,6 +26,7 @@ _USER_DIR = Path.home() / ".whl_copy"
 _USER_CONFIG = _USER_DIR / "config.yml"
 _USER_PRESETS = _USER_DIR / "presets.yml"
 _USER_STATE = _USER_DIR / ".whl_copy_state.json"
+_USER_SENTINEL = _USER_DIR / ".initialized"
 
 _DEFAULT_CONFIG = str(_USER_CONFIG)
 _DEFAULT_PRESETS = str(_USER_PRESETS)
@@ -30,23 +35,73 @@ _DEFAULT_STATE = str(_USER_STATE)
 
 
 def ensure_user_config():
-    """Ensure user config directory and files exist, copying from package if needed."""
+    """Ensure user config directory and files exist, copying from package if needed.
+
+    Once seeded, a sentinel file short-circuits the check to a single stat on
+    warm starts; a config deleted later is covered by load_config's fallback.
+    """
+    if _USER_SENTINEL.exists():
+        return
     _USER_DIR.mkdir(parents=True, exist_ok=True)
     if not _USER_CONFIG.exists():
         _USER_CONFIG.write_text(_PKG_CONFIG.read_text(encoding="utf-8"), encoding="utf-8")
     if not _USER_PRESETS.exists():
         _USER_PRESETS.write_text(_PKG_PRESETS.read_text(encoding="utf-8"), encoding="utf-8")
+    _USER_SENTINEL.touch()
     # State file is created on first run by workflow
 
+
+def _config_cache_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.cache.json")
+
+
+def _read_config_cache(path: Path, st: os.stat_result) -> Optional[dict]:
+    """Return the cached parse of ``path`` if it was taken from this exact file version."""
+    try:
+        cached = json.loads(_config_cache_path(path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if cached.get("mtime_ns") != st.st_mtime_ns or cached.get("size") != st.st_size:
+        return None
+    return cached.get("data")
+
+
+def _write_config_cache(path: Path, st: os.stat_result, data: dict) -> None:
+    payload = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data}
+    try:
+        encoded = json.dumps(payload)
+        # JSON turns non-string keys (e.g. {1: 'fast'}) into strings; a cache
+        # that would load back differently is not written.
+        if json.loads(encoded)["data"] != data:
+            return
+        _config_cache_path(path).write_text(encoded, encoding="utf-8")
+    except (OSError, TypeError, ValueError):
+        # Read-only config dir or YAML values JSON cannot represent: just skip caching.
+        pass
+
+
 def load_config(path: str = str(_DEFAULT_CONFIG)) -> dict:
-    """Load and return YAML configuration, fallback to package config if missing."""
+    """Load and return YAML configuration, fallback to package config if missing.
+
+    Parsed results are cached in a JSON sidecar next to the file and reused
+    while the YAML file's mtime and size are unchanged.
+    """
+    config_path = Path(path)
     try:
-        with open(path, encoding="utf-8") as fh:
-            return yaml.safe_load(fh) or {}
+        st = config_path.stat()
     except FileNotFoundError:
         # Fallback to package config
         with open(_PKG_CONFIG, encoding="utf-8") as fh:
-            return yaml.safe_load(fh) or {}
+            return safe_load(fh) or {}
+
+    cached = _read_config_cache(config_path, st)
+    if cached is not None:
+        return cached
+
+    with open(config_path, encoding="utf-8") as fh:
+        data = safe_load(fh) or {}
+    _write_config_cache(config_path, st, data)
+    return data
 
 
 def parse_args(argv=None) -> argparse.Namespace:
@@ -5,26 +5,87 @@ from __future__ import annotations
 import datetime
 import fnmatch
 import os
+import re
+import string
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Iterable, Iterator, List, Optional, Pattern, Tuple, Union
 
+from whl_copy.utils.size_parser import parse_size_to_bytes
 
+
+@lru_cache(maxsize=128)
 def _parse_sz(s):
     if str(s).lower() in ('unlimited', '0', ''): return 0
-    from whl_copy.utils.size_parser import parse_size_to_bytes
     try: return parse_size_to_bytes(str(s))
     except: return int(s)
 
+class _SuffixMatcher:
+    """Matcher for pattern lists that are all ``*<literal>`` (``*.log``, ``*.bag``, ...).
+
+    One C-level ``str.endswith(tuple)`` replaces the regex alternation;
+    ``match`` mirrors ``re.Pattern.match`` closely enough for callers that
+    only test the result for truthiness.
+    """
+
+    __slots__ = ("suffixes",)
+
+    def __init__(self, suffixes: Tuple[str, ...]):
+        self.suffixes = suffixes
+
+    def match(self, name: str) -> Optional[bool]:
+        return True if name.endswith(self.suffixes) else None
+
+
+Matcher = Union[Pattern[str], _SuffixMatcher]
+_MATCHER_TYPES = (re.Pattern, _SuffixMatcher)
+_GLOB_CHARS = frozenset("*?[")
+
+
+@lru_cache(maxsize=128)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Matcher:
+    if not patterns:
+        return re.compile(r"(?!)")  # matches nothing, like any() over no patterns
+    if all(p.startswith("*") and _GLOB_CHARS.isdisjoint(p[1:]) for p in patterns):
+        return _SuffixMatcher(tuple(p[1:] for p in patterns))
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
+class _DefaultDict(dict):
+    def __missing__(self, key):
+        return ""
+
+
+_FORMATTER = string.Formatter()
+
+
+@lru_cache(maxsize=128)
+def _parse_template(template: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """Split a rule filter like ``{module}/{date}`` into (literal, field) pairs once.
+
+    Returns None for templates using format specs, conversions or attribute
+    access; those keep going through ``format_map``.
+    """
+    parts = []
+    for literal, field, spec, conversion in _FORMATTER.parse(template):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        parts.append((literal, field))
+    return tuple(parts)
+
+
 class FilterEngine:
     @staticmethod
     def build_source_path(cfg: dict, data_type: str, **kwargs: Any) -> str:
         rule = cfg["rules"][data_type]
-
-        class _DefaultDict(dict):
-            def __missing__(self, key):
-                return ""
-
-        pattern = rule["filter"].format_map(_DefaultDict(kwargs))
+        parts = _parse_template(rule["filter"])
+        if parts is None:
+            pattern = rule["filter"].format_map(_DefaultDict(kwargs))
+        else:
+            pattern = "".join(
+                literal + (str(kwargs[field]) if field in kwargs else "") if field else literal
+                for literal, field in parts
+            )
         return os.path.join(cfg["source"]["base_path"], rule["path"], pattern.lstrip("/"))
 
     @staticmethod
@@ -57,24 +118,79 @@ class FilterEngine:
             return datetime.datetime.now() - datetime.timedelta(hours=1)
         return None
 
+    @staticmethod
+    def parse_size_limit(size_limit: Union[str, int]) -> int:
+        """Resolve a size limit ("unlimited", "10M", 1024, ...) to bytes; 0 means no limit."""
+        return _parse_sz(size_limit)
+
+    @staticmethod
+    def compile_patterns(patterns: Iterable[str]) -> Matcher:
+        """Fold glob patterns into one matcher so each file needs a single match().
+
+        Pure extension lists (``*.log``, ``*.bag``) become a suffix check;
+        anything else is combined into one regex.
+        """
+        return _compile_patterns(tuple(patterns))
+
     @staticmethod
     def matches_file_constraints(
-        file_path: Path,
-        patterns: List[str],
-        size_limit_str: str = "unlimited",
+        file_path: Union[Path, os.DirEntry],
+        patterns: Union[List[str], Matcher],
+        size_limit_str: Union[str, int] = "unlimited",
         min_modified_time: Optional[datetime.datetime] = None,
+        stat_result: Optional[os.stat_result] = None,
     ) -> bool:
-        if not any(fnmatch.fnmatch(file_path.name, pattern) for pattern in patterns):
+        """Check name patterns, size and mtime for one file.
+
+        ``file_path`` may be an ``os.DirEntry`` from a scandir walk, whose
+        stat() is cached on the entry; callers holding a stat result already
+        can pass it as ``stat_result`` to skip the syscall entirely.
+        ``patterns`` may be pre-compiled with :meth:`compile_patterns` and
+        ``size_limit_str`` pre-resolved with :meth:`parse_size_limit` (an int
+        is taken as bytes) when filtering many files.
+        """
+        matcher = patterns if isinstance(patterns, _MATCHER_TYPES) else FilterEngine.compile_patterns(patterns)
+        if matcher.match(file_path.name) is None:
             return False
 
-        stat = file_path.stat()
-        sz_limit = _parse_sz(size_limit_str)
+        stat = stat_result if stat_result is not None else file_path.stat()
+        sz_limit = size_limit_str if isinstance(size_limit_str, int) else _parse_sz(size_limit_str)
         if sz_limit and stat.st_size < sz_limit:
             return False
 
-        if min_modified_time:
-            mtime = datetime.datetime.fromtimestamp(stat.st_mtime)
-            if mtime < min_modified_time:
-                return False
+        # Compare raw timestamps; fromtimestamp() would allocate a datetime per file.
+        if min_modified_time and stat.st_mtime < min_modified_time.timestamp():
+            return False
 
         return True
+
+    @staticmethod
+    def filter_entries(
+        entries: Iterable[os.DirEntry],
+        patterns: Union[List[str], Matcher],
+        size_limit_str: Union[str, int] = "unlimited",
+        min_modified_time: Optional[datetime.datetime] = None,
+    ) -> Iterator[os.DirEntry]:
+        """Yield the scandir entries that pass :meth:`matches_file_constraints`.
+
+        Limits are resolved once for the whole batch: the name regex runs
+        before any stat, and mtimes are compared as raw timestamps instead of
+        building a datetime per file. Entries that vanish mid-scan are skipped.
+        """
+        matcher = patterns if isinstance(patterns, _MATCHER_TYPES) else FilterEngine.compile_patterns(patterns)
+        sz_limit = size_limit_str if isinstance(size_limit_str, int) else _parse_sz(size_limit_str)
+        min_ts = min_modified_time.timestamp() if min_modified_time else None
+        match = matcher.match
+
+        for entry in entries:
+            if match(entry.name) is None:
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            if sz_limit and stat.st_size < sz_limit:
+                continue
+            if min_ts is not None and stat.st_mtime < min_ts:
+                continue
+            yield entry
@@ -1,10 +1,18 @@
 """Storage and Virtual File Systems package."""
 
-from whl_copy.storage.base import VirtualFileSystem
-from whl_copy.storage.bos import BosStorage
-from whl_copy.storage.local import FilesystemStorage, LocalStorage
-from whl_copy.storage.registry import build_storage, StorageRegistry
-from whl_copy.storage.rsync import RsyncStorage
+from importlib import import_module
+
+# Backends are re-exported lazily (PEP 562) so importing the package for one
+# backend does not load every other backend's module graph.
+_EXPORTS = {
+    "VirtualFileSystem": "whl_copy.storage.base",
+    "FilesystemStorage": "whl_copy.storage.local",
+    "LocalStorage": "whl_copy.storage.local",
+    "RsyncStorage": "whl_copy.storage.rsync",
+    "BosStorage": "whl_copy.storage.bos",
+    "build_storage": "whl_copy.storage.registry",
+    "StorageRegistry": "whl_copy.storage.registry",
+}
 
 __all__ = [
     "VirtualFileSystem",
@@ -15,3 +23,17 @@ __all__ = [
     "build_storage",
     "StorageRegistry",
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -16,21 +16,25 @@ class FilesystemStorage:
         return True
 
     def get_free_space(self, path: str) -> int:
-        try:
-            check_path = Path(path)
-            while not check_path.exists() and check_path.parent != check_path:
-                check_path = check_path.parent
-            usage = shutil.disk_usage(str(check_path))
-            return usage.free
-        except Exception:
-            return -1
+        # Try the path itself first (usually exists: one statvfs), walking up
+        # only on failure instead of probing exists() at every level.
+        check_path = os.path.abspath(path)
+        while True:
+            try:
+                return shutil.disk_usage(check_path).free
+            except (FileNotFoundError, NotADirectoryError):
+                parent = os.path.dirname(check_path)
+                if parent == check_path:
+                    return -1
+                check_path = parent
+            except Exception:
+                return -1
 
     def list_dirs(self, path: str) -> List[str]:
+        # DirEntry.is_dir() uses the d_type from readdir; only symlinks cost a stat.
         try:
-            p = Path(path)
-            if not p.exists() or not p.is_dir():
-                return []
-            return [d.name for d in p.iterdir() if d.is_dir()]
+            with os.scandir(path) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
         except Exception:
             return []
 
@@ -2,56 +2,401 @@
 
 from __future__ import annotations
 
+import errno
 import os
 import shlex
 import shutil
+import stat
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from whl_copy.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Resolved once at import; which() stats every $PATH entry on each call.
+_RSYNC_PATH = shutil.which("rsync")
 
-def local_copy(src: str, dst: str, verify: bool = False, algorithm: str = "sha256", resume: bool = True) -> None:
+# copy_file_range is Linux-only (Python 3.8+); each call moves up to this many bytes.
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+_HAS_SENDFILE = hasattr(os, "sendfile")
+_COPY_RANGE_CHUNK = 1 << 30
+# Errors meaning "not supported for this fd pair"; shutil's sendfile path handles those.
+_COPY_RANGE_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, errno.ETXTBSY}
+)
+
+
+def _copy_file_range(src_fd: int, dst_fd: int) -> bool:
+    """Copy src_fd to dst_fd in-kernel; False if refused before any byte moved."""
+    copied = 0
+    while True:
+        try:
+            sent = os.copy_file_range(src_fd, dst_fd, _COPY_RANGE_CHUNK)
+        except OSError as exc:
+            if copied == 0 and exc.errno in _COPY_RANGE_FALLBACK_ERRNOS:
+                return False
+            raise
+        if sent == 0:
+            return True
+        copied += sent
+
+
+# fchmod/futimens act on the open destination fd, skipping two path lookups.
+_HAS_FD_METADATA = hasattr(os, "fchmod") and os.utime in os.supports_fd
+
+
+def _apply_stat(dst: str, dst_fd: int, src_stat: os.stat_result) -> None:
+    """Copy mode and times from an already-taken stat (copystat would re-stat src).
+
+    Must run after the last write to ``dst_fd``. Like rsync -a, extended
+    attributes are not copied.
+    """
+    mode = stat.S_IMODE(src_stat.st_mode)
+    times = (src_stat.st_atime_ns, src_stat.st_mtime_ns)
+    if _HAS_FD_METADATA:
+        os.fchmod(dst_fd, mode)
+        os.utime(dst_fd, ns=times)
+    else:
+        os.chmod(dst, mode)
+        os.utime(dst, ns=times)
+
+
+def _sendfile(src_fd: int, dst_fd: int) -> bool:
+    """Copy src_fd to dst_fd with sendfile; False if refused before any byte moved."""
+    offset = 0
+    while True:
+        try:
+            sent = os.sendfile(dst_fd, src_fd, offset, _COPY_RANGE_CHUNK)
+        except OSError as exc:
+            if offset == 0 and exc.errno in _COPY_RANGE_FALLBACK_ERRNOS:
+                return False
+            raise
+        if sent == 0:
+            return True
+        offset += sent
+
+
+def _refuse_same_file(src: str, dst: str, src_stat: os.stat_result) -> None:
+    """Raise before ``dst`` is opened for writing if it is ``src`` itself.
+
+    Opening with "wb" truncates first, so copying a file onto itself (or onto
+    a hard link to it) would otherwise leave it empty.
+    """
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return
+    if (dst_stat.st_dev, dst_stat.st_ino) == (src_stat.st_dev, src_stat.st_ino):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+
+def _copy_file(src: str, dst: str, src_stat: Optional[os.stat_result] = None) -> str:
+    """shutil.copy2 equivalent that prefers copy_file_range (no userspace buffer)."""
+    src_stat = src_stat or os.stat(src)
+    if not stat.S_ISREG(src_stat.st_mode):
+        # open() would block on a FIFO; copy2 raises SpecialFileError instead.
+        return shutil.copy2(src, dst)
+    _refuse_same_file(src, dst, src_stat)
+    if _HAS_COPY_FILE_RANGE:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            # Across filesystems copy_file_range may refuse (EXDEV); sendfile on
+            # the fds already open is still zero-copy and skips copy2's reopen.
+            done = _copy_file_range(src_fd, dst_fd) or (_HAS_SENDFILE and _sendfile(src_fd, dst_fd))
+            if done:
+                _apply_stat(dst, dst_fd, src_stat)
+        if done:
+            return dst
+    # copyfile() already uses sendfile on Linux / fcopyfile on macOS.
+    return shutil.copy2(src, dst)
+
+
+def _is_up_to_date(src: str, dst: str, src_stat: Optional[os.stat_result] = None) -> bool:
+    """rsync --update plus its quick check: skip a newer destination, or one with same mtime and size."""
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return False
+    src_stat = src_stat or os.stat(src)
+    if dst_stat.st_mtime > src_stat.st_mtime:
+        return True
+    return dst_stat.st_mtime == src_stat.st_mtime and dst_stat.st_size == src_stat.st_size
+
+
+def _copy_file_resumable(src: str, dst: str, src_stat: Optional[os.stat_result] = None) -> str:
+    # One stat of src serves the up-to-date check and the metadata copy.
+    src_stat = src_stat or os.stat(src)
+    if _is_up_to_date(src, dst, src_stat):
+        return dst
+    return _copy_file(src, dst, src_stat)
+
+
+_HASH_COPY_CHUNK = 1 << 20
+
+
+def _copy_file_hashing(src: str, dst: str, algorithm: str, src_stat: Optional[os.stat_result] = None) -> str:
+    """Copy src to dst and return src's digest, hashing each slice as it is written.
+
+    Each slice is read once into a reused buffer and both hashed and written
+    from it; verification then only has to read the destination back. Plain
+    reads (not mmap) keep a source truncated mid-copy, e.g. by logrotate's
+    copytruncate, from killing the process with SIGBUS.
+    """
+    from whl_copy.core.checksum import new_hasher  # noqa: PLC0415
+
+    src_stat = src_stat or os.stat(src)
+    if not stat.S_ISREG(src_stat.st_mode):
+        raise shutil.SpecialFileError(f"`{src}` is not a regular file")
+    _refuse_same_file(src, dst, src_stat)
+    hasher = new_hasher(algorithm)
+    buffer = memoryview(bytearray(_HASH_COPY_CHUNK))
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb") as fdst:
+        while True:
+            read = fsrc.readinto(buffer)
+            if not read:
+                break
+            chunk = buffer[:read]
+            hasher.update(chunk)
+            fdst.write(chunk)
+        # Buffered bytes landing at close() would bump the mtime just set.
+        fdst.flush()
+        _apply_stat(dst, fdst.fileno(), src_stat)
+    return hasher.hexdigest()
+
+
+def _hashing_copy_function(
+    algorithm: str, resume: bool, dest_root: str, digests: Dict[str, str]
+) -> Callable[..., str]:
+    """_copytree_parallel copy_function that records source digests by POSIX relative path."""
+
+    # The tree walk builds each dst as os.path.join(dest_root, ...), so the relative
+    # path is a plain slice; relpath would abspath (getcwd) both sides per file.
+    prefix_len = len(os.path.join(dest_root, ""))
+
+    def copy(src: str, dst: str, src_stat: Optional[os.stat_result] = None) -> str:
+        src_stat = src_stat or os.stat(src)
+        if resume and _is_up_to_date(src, dst, src_stat):
+            return dst
+        rel = dst[prefix_len:]
+        if os.sep != "/":
+            rel = rel.replace(os.sep, "/")
+        digests[rel] = _copy_file_hashing(src, dst, algorithm, src_stat)
+        return dst
+
+    return copy
+
+
+# Per-file copies release the GIL in the kernel copy calls, so a small pool
+# overlaps open/close/metadata latency on trees of many small files.
+_COPY_WORKERS = 8
+
+
+# What link(2) reports when the filesystem cannot hold the link at all (e.g.
+# vfat/exfat USB disks give EPERM); anything else, such as EACCES, would make
+# the copy fallback fail the same way.
+_LINK_UNSUPPORTED_ERRNOS = frozenset({errno.EPERM, errno.EMLINK, errno.EXDEV, errno.EOPNOTSUPP})
+
+
+def _link_or_copy(first_dst: str, dst: str) -> None:
+    """Recreate a source hard link in the destination, copying where links are unsupported."""
+    if os.path.lexists(dst):
+        if os.path.samefile(first_dst, dst):
+            return
+        os.unlink(dst)
+    try:
+        os.link(first_dst, dst)
+    except OSError as exc:
+        if exc.errno not in _LINK_UNSUPPORTED_ERRNOS:
+            raise
+        _copy_file(first_dst, dst)
+
+
+def _make_dir(path: str) -> None:
+    """Create ``path``, or make an existing one owner-writable for this run.
+
+    Directory modes are only applied once every entry has been written, so a
+    read-only source directory (or a read-only copy of one left by an earlier
+    run) does not lock out the files still to be copied into it.
+    """
+    try:
+        os.makedirs(path)
+    except FileExistsError:
+        mode = os.stat(path).st_mode
+        if stat.S_ISDIR(mode) and mode & 0o300 != 0o300:
+            os.chmod(path, stat.S_IMODE(mode) | 0o300)
+
+
+def _copy_symlink(src: str, dst: str) -> None:
+    """Recreate a symlink like rsync -l, replacing one left by an earlier run."""
+    target = os.readlink(src)
+    if os.path.islink(dst):
+        os.unlink(dst)
+    os.symlink(target, dst)
+    shutil.copystat(src, dst, follow_symlinks=False)
+
+
+def _copytree_parallel(src: str, dst: Path, copy_function: Callable[..., str], workers: int) -> None:
+    """Copy the tree under ``src`` to ``dst``, handing each file to a thread pool.
+
+    Directories are created while walking (before any file inside them is
+    submitted); only the file copies run concurrently. Files hard-linked to
+    each other inside ``src`` are copied once and linked (like rsync -H), so
+    a snapshot-style tree does not multiply its bytes. Symlinks are copied as
+    links (like rsync -l) and other non-regular files go to shutil.copy2,
+    which refuses FIFOs and sockets instead of blocking. Directory modes and
+    times are applied last, deepest first, once nothing more is written.
+    Per-entry failures are collected and raised together as shutil.Error.
+    ``copy_function`` is called as ``(src, dst, src_stat)``.
+    """
+    seen: Dict[Tuple[int, int], str] = {}
+    links: List[Tuple[str, str]] = []
+    dirs: List[Tuple[str, str]] = []
+    futures = []
+    errors: List[Tuple[str, str, str]] = []
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    def dispatch(file_src: str, file_dst: str) -> None:
+        src_stat = os.stat(file_src)
+        if not stat.S_ISREG(src_stat.st_mode):
+            shutil.copy2(file_src, file_dst)
+            return
+        if src_stat.st_nlink > 1:
+            first_dst = seen.setdefault((src_stat.st_dev, src_stat.st_ino), file_dst)
+            if first_dst != file_dst:
+                links.append((first_dst, file_dst))
+                return
+        if executor is None:
+            copy_function(file_src, file_dst, src_stat)
+        else:
+            futures.append((file_src, file_dst, executor.submit(copy_function, file_src, file_dst, src_stat)))
+
+    try:
+        pending = [(src, str(dst))]
+        while pending:
+            dir_src, dir_dst = pending.pop()
+            _make_dir(dir_dst)
+            dirs.append((dir_src, dir_dst))
+            with os.scandir(dir_src) as entries:
+                for entry in entries:
+                    entry_dst = os.path.join(dir_dst, entry.name)
+                    try:
+                        if entry.is_symlink():
+                            _copy_symlink(entry.path, entry_dst)
+                        elif entry.is_dir():
+                            pending.append((entry.path, entry_dst))
+                        else:
+                            dispatch(entry.path, entry_dst)
+                    except OSError as exc:
+                        errors.append((entry.path, entry_dst, str(exc)))
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    for file_src, file_dst, future in futures:
+        try:
+            future.result()
+        except OSError as exc:
+            errors.append((file_src, file_dst, str(exc)))
+
+    # Before directory modes are restored, so read-only directories still take the links.
+    for first_dst, file_dst in links:
+        try:
+            _link_or_copy(first_dst, file_dst)
+        except OSError as exc:
+            errors.append((first_dst, file_dst, str(exc)))
+
+    # Each directory was appended before its subdirectories, so the reverse
+    # order restamps children first; a parent losing u+x cannot block them.
+    for dir_src, dir_dst in reversed(dirs):
+        try:
+            shutil.copystat(dir_src, dir_dst)
+        except OSError as exc:
+            errors.append((dir_src, dir_dst, str(exc)))
+
+    if errors:
+        raise shutil.Error(errors)
+
+
+def _same_filesystem(src: str, dst: str) -> bool:
+    try:
+        return os.stat(src).st_dev == os.stat(dst).st_dev
+    except OSError:
+        return False
+
+
+def _run_rsync(cmd: List[str]) -> None:
+    """Run rsync discarding its -v file list; stderr is kept only to report failures."""
+    try:
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    except subprocess.CalledProcessError as exc:
+        logger.error("rsync exited with %d: %s", exc.returncode, exc.stderr.decode(errors="replace").strip())
+        raise
+
+
+def local_copy(
+    src: str,
+    dst: str,
+    verify: bool = False,
+    algorithm: str = "sha256",
+    resume: bool = True,
+    workers: int = _COPY_WORKERS,
+) -> None:
     src_path = Path(src)
     if not src_path.exists():
         raise FileNotFoundError(f"Source path does not exist: {src}")
 
     os.makedirs(dst, exist_ok=True)
 
-    # Try to use rsync for local copy if resume is requested and rsync is available
-    if resume and shutil.which("rsync"):
-        cmd = ["rsync", "-avz", "--partial", "--update"]
+    # rsync's --partial resume only pays for its fork + stat walk across devices
+    # (e.g. onto a USB disk); within one filesystem the native path below wins.
+    if resume and _RSYNC_PATH and not _same_filesystem(src, dst):
+        cmd = [_RSYNC_PATH, "-avz", "--hard-links", "--partial", "--update"]
         if verify:
             cmd.append("--checksum")
-        cmd.extend([src, dst])
+        # A trailing slash makes rsync copy only the contents; the native
+        # path below always lands at dst/<name>, so drop it here too.
+        cmd.extend([src.rstrip(os.sep) or src, dst])
         logger.debug("Running local rsync: %s", " ".join(cmd))
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        _run_rsync(cmd)
         return
 
+    # With resume, files already present and up to date are skipped (like --update).
+    copy_function = _copy_file_resumable if resume else _copy_file
+
     if src_path.is_dir():
         dest_path = Path(dst) / src_path.name
-        shutil.copytree(src, dest_path, dirs_exist_ok=True)
+        if dest_path.exists() and os.path.samefile(src, dest_path):
+            # Caught here so the tree walk does not bury it in a per-file error list.
+            raise shutil.SameFileError(f"{src!r} and {str(dest_path)!r} are the same directory")
+        src_hashes: Dict[str, str] = {}
+        if verify:
+            copy_function = _hashing_copy_function(algorithm, resume, str(dest_path), src_hashes)
+        _copytree_parallel(src, dest_path, copy_function, workers)
         logger.info("Directory copied: %s -> %s", src, dest_path)
         if verify:
             from whl_copy.core.checksum import verify_directory  # noqa: PLC0415
 
-            ok = verify_directory(src, str(dest_path), algorithm=algorithm)
+            ok = verify_directory(src, str(dest_path), algorithm=algorithm, src_hashes=src_hashes)
             if not ok:
                 raise RuntimeError(
                     f"Checksum verification failed for {src} -> {dest_path}"
                 )
             logger.info("Checksum verification passed [%s]: %s", algorithm, dest_path)
     else:
-        shutil.copy2(src, dst)
+        dst_file = Path(dst) / src_path.name
+        src_hash = None
+        if verify and not (resume and _is_up_to_date(src, str(dst_file))):
+            src_hash = _copy_file_hashing(src, str(dst_file), algorithm)
+        else:
+            copy_function(src, str(dst_file))
         logger.info("File copied: %s -> %s", src, dst)
         if verify:
             from whl_copy.core.checksum import compute_checksum  # noqa: PLC0415
 
-            dst_file = Path(dst) / src_path.name if Path(dst).is_dir() else Path(dst)
-            src_hash = compute_checksum(src, algorithm)
+            src_hash = src_hash or compute_checksum(src, algorithm)
             dst_hash = compute_checksum(str(dst_file), algorithm)
             if src_hash != dst_hash:
                 raise RuntimeError(
@@ -61,13 +406,34 @@ def local_copy(src: str, dst: str, verify: bool = False, algorithm: str = "sha25
             logger.info("Checksum verification passed [%s]: %s", algorithm, dst_file)
 
 
-def _build_ssh_cmd(ssh_key: Optional[str]) -> str:
+# OpenSSH connection sharing: the free-space probe, exists/mkdir and the rsync
+# transfer that follow it reuse one master connection instead of one handshake each.
+_SSH_MULTIPLEX_OPTS = (
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPath=~/.ssh/cm-%r@%h:%p",
+    "-o", "ControlPersist=60s",
+)
+
+
+def _build_ssh_cmd(ssh_key: Optional[str], multiplex: bool = False) -> str:
     parts = ["ssh"]
     if ssh_key:
         parts += ["-i", shlex.quote(ssh_key)]
+    if multiplex:
+        parts += _SSH_MULTIPLEX_OPTS
     return " ".join(parts)
 
 
+def _build_ssh_argv(ssh_key: Optional[str], multiplex: bool = False) -> List[str]:
+    """argv form of _build_ssh_cmd for running ssh directly, without /bin/sh."""
+    argv = ["ssh"]
+    if ssh_key:
+        argv += ["-i", ssh_key]
+    if multiplex:
+        argv += _SSH_MULTIPLEX_OPTS
+    return argv
+
+
 def rsync_push(
     src: str,
     dst: str,
@@ -78,9 +444,9 @@ def rsync_push(
     filter_args: Optional[List[str]] = None,
     resume: bool = True,
 ) -> None:
-    ssh_cmd = _build_ssh_cmd(ssh_key)
+    ssh_cmd = _build_ssh_cmd(ssh_key, multiplex=True)
 
-    cmd = ["rsync", "-avz", "--update"]
+    cmd = ["rsync", "-avz", "--hard-links", "--update"]
     if resume:
         cmd.append("--partial")
     if filter_args:
@@ -90,7 +456,7 @@ def rsync_push(
         cmd.extend(extra_args)
 
     logger.debug("Running: %s", " ".join(cmd))
-    subprocess.run(cmd, check=True, capture_output=True, text=True)
+    _run_rsync(cmd)
     logger.debug("rsync push completed: %s -> %s@%s:%s", src, user, host, dst)
 
 def rsync_pull(
@@ -103,9 +469,9 @@ def rsync_pull(
     filter_args: Optional[List[str]] = None,
     resume: bool = True,
 ) -> None:
-    ssh_cmd = _build_ssh_cmd(ssh_key)
+    ssh_cmd = _build_ssh_cmd(ssh_key, multiplex=True)
 
-    cmd = ["rsync", "-avz", "--update"]
+    cmd = ["rsync", "-avz", "--hard-links", "--update"]
     if resume:
         cmd.append("--partial")
     if filter_args:
@@ -115,5 +481,5 @@ def rsync_pull(
         cmd.extend(extra_args)
 
     logger.debug("Running: %s", " ".join(cmd))
-    subprocess.run(cmd, check=True, capture_output=True, text=True)
+    _run_rsync(cmd)
     logger.debug("rsync pull completed: %s@%s:%s -> %s", user, host, src, dst)
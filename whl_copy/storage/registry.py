@@ -5,9 +5,6 @@ from __future__ import annotations
 from typing import Callable, Dict
 
 from whl_copy.storage.base import VirtualFileSystem
-from whl_copy.storage.bos import BosStorage
-from whl_copy.storage.local import FilesystemStorage, LocalStorage
-from whl_copy.storage.rsync import RsyncStorage
 from whl_copy.core.destination_service import DestinationAddressResolver
 from whl_copy.core.domain import CopyPlan
 
@@ -32,13 +29,39 @@ class StorageRegistry:
         return self._factories[key]
 
 
+# Backend modules are imported on first use, so a local copy never loads the
+# rsync/BOS backends.
+def _bos_storage(_plan: CopyPlan) -> VirtualFileSystem:
+    from whl_copy.storage.bos import BosStorage  # noqa: PLC0415
+
+    return BosStorage()
+
+
+def _rsync_storage(resolver: DestinationAddressResolver) -> VirtualFileSystem:
+    from whl_copy.storage.rsync import RsyncStorage  # noqa: PLC0415
+
+    return RsyncStorage(address_resolver=resolver)
+
+
+def _filesystem_storage(_plan: CopyPlan) -> VirtualFileSystem:
+    from whl_copy.storage.local import FilesystemStorage  # noqa: PLC0415
+
+    return FilesystemStorage()
+
+
+def _local_storage(_plan: CopyPlan) -> VirtualFileSystem:
+    from whl_copy.storage.local import LocalStorage  # noqa: PLC0415
+
+    return LocalStorage()
+
+
 def _default_registry(address_resolver: DestinationAddressResolver | None = None) -> StorageRegistry:
     resolver = address_resolver or DestinationAddressResolver()
     registry = StorageRegistry()
-    registry.register("bos", lambda _plan: BosStorage())
-    registry.register("remote", lambda _plan: RsyncStorage(address_resolver=resolver))
-    registry.register("filesystem", lambda _plan: FilesystemStorage())
-    registry.register("local", lambda _plan: LocalStorage())
+    registry.register("bos", _bos_storage)
+    registry.register("remote", lambda _plan: _rsync_storage(resolver))
+    registry.register("filesystem", _filesystem_storage)
+    registry.register("local", _local_storage)
     return registry
 
 
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import posixpath
+import shlex
 import subprocess
 from typing import List
 
-from whl_copy.storage.operations import rsync_push, rsync_pull, _build_ssh_cmd
+from whl_copy.storage.operations import rsync_push, rsync_pull, _build_ssh_argv
 from whl_copy.core.destination_service import DestinationAddressResolver
 from whl_copy.core.domain import CopyPlan
 
@@ -24,15 +26,19 @@ class RsyncStorage:
             return plan.destination
         return plan.source
 
+    def _ssh_argv(self, path: str, *remote_cmd: str) -> List[str]:
+        # ssh joins the remote command with spaces for the remote shell, so the
+        # path is quoted once here; no local shell is involved.
+        user, host, remote_path = self.address_resolver.split_remote_destination(path)
+        return [*_build_ssh_argv(None, multiplex=True), f"{user}@{host}", *remote_cmd, shlex.quote(remote_path)]
+
     def exists(self, path: str) -> bool:
         if not self.address_resolver.is_remote(path):
             import os
             return os.path.exists(path)
         try:
-            user, host, remote_path = self.address_resolver.split_remote_destination(path)
-            ssh_cmd = _build_ssh_cmd(None)
-            cmd = f"{ssh_cmd} {user}@{host} test -e '{remote_path}'"
-            return subprocess.run(cmd, shell=True).returncode == 0
+            cmd = self._ssh_argv(path, "test", "-e")
+            return subprocess.run(cmd).returncode == 0
         except Exception:
             return False
 
@@ -41,10 +47,8 @@ class RsyncStorage:
             import os
             os.makedirs(path, exist_ok=True)
             return
-        user, host, remote_path = self.address_resolver.split_remote_destination(path)
-        ssh_cmd = _build_ssh_cmd(None)
-        cmd = f"{ssh_cmd} {user}@{host} mkdir -p '{remote_path}'"
-        subprocess.run(cmd, shell=True, check=True)
+        cmd = self._ssh_argv(path, "mkdir", "-p")
+        subprocess.run(cmd, check=True)
 
     def get_free_space(self, path: str) -> int:
         if not self.address_resolver.is_remote(path):
@@ -54,11 +58,11 @@ class RsyncStorage:
             except:
                 return -1
         try:
-            user, host, remote_path = self.address_resolver.split_remote_destination(path)
-            ssh_cmd = _build_ssh_cmd(None)
-            cmd = f"{ssh_cmd} {user}@{host} df -k '{remote_path}' | tail -1 | awk '{{print $4}}'"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=True)
-            return int(result.stdout.strip()) * 1024
+            # POSIX df output (-P, 1K blocks) is the same on GNU, BusyBox and BSD;
+            # "Available" is the fourth field of the last line.
+            cmd = self._ssh_argv(path, "df", "-Pk")
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            return int(result.stdout.strip().splitlines()[-1].split()[3]) * 1024
         except Exception:
             return -1
 
@@ -70,11 +74,10 @@ class RsyncStorage:
             except:
                 return []
         try:
-            user, host, remote_path = self.address_resolver.split_remote_destination(path)
-            ssh_cmd = _build_ssh_cmd(None)
-            cmd = f"{ssh_cmd} {user}@{host} find '{remote_path}' -maxdepth 1 -mindepth 1 -type d -exec basename {{}} \;"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=True)
-            return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+            # No -printf: BusyBox and BSD find lack it, so names are cut locally.
+            cmd = self._ssh_argv(path, "find") + ["-mindepth", "1", "-maxdepth", "1", "-type", "d"]
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            return [posixpath.basename(line) for line in result.stdout.splitlines() if line]
         except Exception:
             return []
 
@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=128)
 def parse_size_to_bytes(size_str: str) -> int:
     if not size_str or size_str.lower() == 'unlimited':
         return 0
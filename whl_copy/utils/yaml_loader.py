@@ -0,0 +1,12 @@
+"""YAML loading helpers preferring the libyaml C loader."""
+from typing import Any
+
+import yaml
+
+# CSafeLoader is only present when PyYAML was built against libyaml.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_load(stream: Any) -> Any:
+    """Drop-in for ``yaml.safe_load`` that uses the C loader when available."""
+    return yaml.load(stream, Loader=_SafeLoader)
@@ -4,6 +4,7 @@ from __future__ import annotations
 import os
 import re
 import sys
+import time
 import uuid
 from pathlib import Path
 from typing import List, Optional, Tuple, Any
@@ -19,6 +20,13 @@ from whl_copy.discovery.registry import DeviceDiscoveryManager
 from whl_copy.discovery.base import DeviceConnection
 from whl_copy.utils.interaction import PromptAdapter, build_prompt_adapter
 
+# Redraw the progress bar at most ~20 times per second.
+_PROGRESS_MIN_INTERVAL = 0.05
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+# Choice-list group for each discovered device kind; unknown kinds go last.
+_DEVICE_GROUPS = {"local": 0, "removable": 0, "cloud": 1, "remote": 2}
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
 class CopyWizard:
     """Job-Centric Wizard orchestration for source<->destination workflows."""
 
@@ -46,6 +54,8 @@ class CopyWizard:
         self.output = output_func
         self.state = self.store.load()
         self.transport_service = TransportService()
+        self._last_progress: Tuple[int, float] = (-1, 0.0)
+        self._bar_template = ""
 
     def run(self) -> int:
         self._write("=== Whl-Copy Sync Manager (Bidirectional) ===")
@@ -128,30 +138,18 @@ class CopyWizard:
         for ep in endpoints:
             choices.append(f"[Saved] {ep.name} ({ep.backend_key}: {ep.full_path})")
 
-        local_devs = []
-        cloud_devs = []
-        remote_devs = []
-        network_devs = []
-
+        # One bucketing pass: local/removable, cloud, remote, then anything else
+        # (network sniffing) last; devices keep discovery order within a group.
+        groups: List[List[str]] = [[], [], [], []]
         for d in devices:
-            if d.kind in ("local", "removable"):
-                local_devs.append(d)
-            elif d.kind == "cloud":
-                cloud_devs.append(d)
-            elif d.kind == "remote":
-                remote_devs.append(d)
+            group = _DEVICE_GROUPS.get(d.kind)
+            if group is None:
+                # Simple text label, no ANSI to prevent terminal issues
+                groups[-1].append(f"[Discovered: network (Unverified)] {d.label} ({d.address})")
             else:
-                network_devs.append(d)
-
-        ordered_devices = local_devs + cloud_devs + remote_devs
-
-        for d in ordered_devices:
-            choices.append(f"[Discovered: {d.kind}] {d.label} ({d.address})")
-
-        for d in network_devs:
-            # Simple text label, no ANSI to prevent terminal issues
-            tag = "[Discovered: network (Unverified)]"
-            choices.append(f"{tag} {d.label} ({d.address})")
+                groups[group].append(f"[Discovered: {d.kind}] {d.label} ({d.address})")
+        for group_choices in groups:
+            choices.extend(group_choices)
 
         local_dir = os.getcwd() if default_local else "/tmp/copy_test"
         choices.append(f"[Manual] Enter a custom path")
@@ -159,8 +157,7 @@ class CopyWizard:
         selected = self.prompt.select(msg, choices=choices, default_index=0)
 
         # Remove ANSI escape sequences for matching
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        selected_clean = ansi_escape.sub('', selected)
+        selected_clean = _ANSI_ESCAPE_RE.sub('', selected)
 
         if selected_clean.startswith("[Saved]"):
             for ep in endpoints:
@@ -264,8 +261,16 @@ class CopyWizard:
         return self._preview_files(plan)
 
     def _preview_files(self, plan: CopyPlan) -> Tuple[List[Path], int]:
+        # The scan itself is a single scandir walk (see core.scanner); only an
+        # empty local result costs one more stat to explain why.
         files, total_bytes = self.transport_service.preview(plan)
-        if not files and not total_bytes and not Path(plan.source).expanduser().exists() and "://" not in plan.source and "@" not in plan.source:
+        if (
+            not files
+            and not total_bytes
+            and "://" not in plan.source
+            and "@" not in plan.source
+            and not os.path.exists(os.path.expanduser(plan.source))
+        ):
             self._write(f"Source not found locally: {plan.source}")
         return files, total_bytes
 
@@ -286,6 +291,8 @@ class CopyWizard:
 
     def _transport(self, plan: CopyPlan) -> None:
         self._write("\n[Transport] Executing engine...")
+        # A previous transfer may have failed before reaching 100%.
+        self._last_progress = (-1, 0.0)
         self._progress_bar(0)
         self.transport_service.execute(plan)
         self._progress_bar(100)
@@ -294,8 +301,16 @@ class CopyWizard:
         self._write("\n[Complete] Sync workflow finished successfully.")
 
     def _progress_bar(self, percent: int, width: int = 28) -> None:
-        done = int(width * max(0, min(percent, 100)) / 100)
-        bar = "#" * done + "-" * (width - done)
+        now = time.monotonic()
+        last_percent, last_ts = self._last_progress
+        if percent < 100 and (percent == last_percent or now - last_ts < _PROGRESS_MIN_INTERVAL):
+            return
+        self._last_progress = (percent, now) if percent < 100 else (-1, 0.0)
+
+        if len(self._bar_template) != 2 * width:
+            self._bar_template = "#" * width + "-" * width
+        done = width * max(0, min(percent, 100)) // 100
+        bar = self._bar_template[width - done:2 * width - done]
         self._write(f"\r[{bar}] {percent:3d}%", end="" if percent < 100 else "\n")
         if percent < 100:
             sys.stdout.flush()
@@ -305,13 +320,11 @@ class CopyWizard:
 
     @staticmethod
     def _format_size(size_bytes: int) -> str:
-        units = ["B", "KB", "MB", "GB", "TB"]
-        value = float(size_bytes)
-        for unit in units:
-            if value < 1024 or unit == units[-1]:
-                return f"{value:.2f} {unit}" if unit != "B" else f"{int(value)} B"
-            value /= 1024
-        return f"{size_bytes} B"
+        # Each unit is 2**10 of the previous one, so bit_length picks it directly.
+        idx = min((max(size_bytes, 1).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        if idx == 0:
+            return f"{size_bytes} B"
+        return f"{size_bytes / (1 << (idx * 10)):.2f} {_SIZE_UNITS[idx]}"
 
     @staticmethod
     def _format_duration(seconds: int) -> str: